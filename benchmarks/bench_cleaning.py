@@ -0,0 +1,85 @@
+"""Bandingkan kernel `shopee_filter.cleaning.clean_columns` dengan rantai astype(str).str.replace lama.
+
+Contoh:
+    python benchmarks/bench_cleaning.py --rows 1000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from shopee_filter.cleaning import clean_columns, clean_flag  # noqa: E402
+from shopee_filter.modes import SHOPTIK_NUMERIC_COLUMNS  # noqa: E402
+
+
+def make_shoptik_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'trendPercentage': [f"{v:.1f}%" for v in rng.uniform(-50, 400, rows)],
+        'Harga': [f"Rp{v}" for v in rng.integers(1_000, 2_000_000, rows)],
+        'Penjualan (30 Hari)': rng.integers(0, 10_000, rows),
+        'Stok': rng.integers(0, 5_000, rows),
+        'Peringkat': [f"{v:.1f}".replace('.', ',') for v in rng.uniform(3, 5, rows)],
+        'isAd': rng.choice(['True', 'False'], rows),
+    })
+
+
+def legacy_preprocess_shoptik(df):
+    # Salinan preprocessing Shoptik sebelum kernel dipakai, sebagai pembanding
+    df['trendPercentage'] = pd.to_numeric(df['trendPercentage'].astype(str).str.replace('%', ''), errors='coerce').fillna(0)
+    df['Harga'] = pd.to_numeric(df['Harga'].astype(str).str.replace(r'[^0-9.]', '', regex=True), errors='coerce').fillna(0)
+    df['Penjualan (30 Hari)'] = pd.to_numeric(df['Penjualan (30 Hari)'], errors='coerce').fillna(0)
+    df['Stok'] = pd.to_numeric(df['Stok'], errors='coerce').fillna(0)
+    df['Peringkat'] = pd.to_numeric(
+        df['Peringkat'].astype(str).str.replace(',', '.').str.extract(r'(\d+\.?\d*)', expand=False),
+        errors='coerce'
+    ).fillna(0)
+    df['isAd'] = df['isAd'].astype(str).str.contains('True|1|Ya|Yes', case=False, na=False)
+    return df
+
+
+def kernel_preprocess_shoptik(df):
+    clean_columns(df, SHOPTIK_NUMERIC_COLUMNS)
+    df['isAd'] = clean_flag(df['isAd'], 'True|1|Ya|Yes')
+    return df
+
+
+def best_of(func, source, repeat):
+    timings = []
+    for _ in range(repeat):
+        df = source.copy()
+        started = time.perf_counter()
+        result = func(df)
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=500_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    source = make_shoptik_frame(args.rows)
+    legacy_time, legacy = best_of(legacy_preprocess_shoptik, source, args.repeat)
+    kernel_time, kernel = best_of(kernel_preprocess_shoptik, source, args.repeat)
+
+    for col in SHOPTIK_NUMERIC_COLUMNS:
+        np.testing.assert_allclose(kernel[col].to_numpy(dtype='float64'),
+                                   legacy[col].to_numpy(dtype='float64'), rtol=1e-6)
+    assert (kernel['isAd'] == legacy['isAd']).all()
+
+    legacy_bytes = legacy.memory_usage(deep=True).sum()
+    kernel_bytes = kernel.memory_usage(deep=True).sum()
+    print(f"rows={args.rows}")
+    print(f"legacy: {legacy_time:.3f}s  {legacy_bytes / 2**20:.1f} MiB")
+    print(f"kernel: {kernel_time:.3f}s  {kernel_bytes / 2**20:.1f} MiB")
+    print(f"speedup: {legacy_time / kernel_time:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
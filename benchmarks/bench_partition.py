@@ -0,0 +1,76 @@
+"""Bandingkan anti-join lama (index.isin) dengan `shopee_filter.filter_engine.partition_rows`.
+
+Contoh:
+    python benchmarks/bench_partition.py --rows 1000000 5000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from shopee_filter.filter_engine import partition_rows  # noqa: E402
+
+
+def make_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Link Produk': pd.array([f"https://shopee.co.id/p-i.{i}.{i * 7}" for i in range(rows)],
+                                dtype='string[pyarrow]'),
+        'Harga': rng.integers(1_000, 2_000_000, rows).astype('float64'),
+        'Stock': rng.integers(0, 5_000, rows).astype('int32'),
+        'Komisi(%)': rng.uniform(0, 15, rows).astype('float32'),
+    })
+
+
+def legacy_partition(df, mask):
+    # Cara lama: bentuk data lolos, lalu cari sisanya dengan mencocokkan index
+    filtered_df = df[mask]
+    removed_df = df[~df.index.isin(filtered_df.index)]
+    return filtered_df.reset_index(drop=True), removed_df.reset_index(drop=True)
+
+
+def take_rows(df, positions):
+    # Ambil baris berdasarkan posisi dengan index baru 0..n-1 tanpa salinan tambahan dari reset_index
+    rows = df.take(positions)
+    rows.index = pd.RangeIndex(len(rows))
+    return rows
+
+
+def mask_partition(df, mask):
+    passed, removed = partition_rows(mask)
+    return take_rows(df, passed), take_rows(df, removed)
+
+
+def best_of(func, df, mask, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(df, mask)
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        df = make_frame(rows)
+        mask = (df['Stock'].to_numpy() >= 100) & (df['Komisi(%)'].to_numpy() <= np.float32(8))
+        legacy_time, (legacy_passed, legacy_removed) = best_of(legacy_partition, df, mask, args.repeat)
+        mask_time, (passed, removed) = best_of(mask_partition, df, mask, args.repeat)
+
+        pd.testing.assert_frame_equal(passed, legacy_passed)
+        pd.testing.assert_frame_equal(removed, legacy_removed)
+        print(f"rows={rows}  legacy: {legacy_time:.3f}s  mask: {mask_time:.3f}s  "
+              f"speedup: {legacy_time / mask_time:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
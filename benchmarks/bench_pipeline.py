@@ -0,0 +1,165 @@
+"""Ukur waktu dan memori puncak tiap tahap pipeline per mode, lalu bandingkan dengan baseline.
+
+Yang dijalankan adalah kode produksi: `run_pipeline` (baca per chunk lewat
+`load_files`, hapus duplikat, cek link lama dengan `LinkTracker`,
+preprocessing per chunk, gabung, ringkas dtype, filter, pisahkan) lalu
+`build_export` untuk file lolos dan sampah. Angka per tahap diambil dari
+record `Profiler` yang juga tampil di panel Profil dan `--profile` CLI.
+Indeks link memakai SQLite sementara yang kosong di setiap putaran, jadi
+semua produk tercatat sebagai baru. Waktu diambil dari median --repeat
+kali; memori puncak diukur di satu putaran tambahan dengan
+tracemalloc (alokasi NumPy/pandas tercatat, buffer internal pyarrow tidak).
+Dengan --workers 1 (default) file dibaca berurutan, sehingga waktu dan
+memori puncak per tahap tidak tercampur file lain. Regresi hanya dihitung
+jika selisihnya melewati toleransi relatif dan juga batas absolut
+(--time-floor, --memory-floor), agar tahap yang hanya beberapa milidetik
+tidak gagal karena noise.
+
+Contoh:
+    python benchmarks/bench_pipeline.py --rows 10000 100000 1000000 --save-baseline
+    python benchmarks/bench_pipeline.py --rows 10000 100000 1000000   # gagal (exit 1) jika ada regresi
+    python benchmarks/bench_pipeline.py --modes shopee --rows 5000000 --files 4 --workers 4
+"""
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+from shopee_filter.exporter import EXPORT_FORMATS, build_export  # noqa: E402
+from shopee_filter.link_store import LinkTracker  # noqa: E402
+from shopee_filter.loader import export_columns  # noqa: E402
+from shopee_filter.modes import MODES  # noqa: E402
+from shopee_filter.pipeline import run_pipeline  # noqa: E402
+from shopee_filter.profiling import Profiler  # noqa: E402
+from synthetic import write_exports  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+# Batas non-default agar klausa 'contains' Lokasi Toko ikut terukur
+BENCH_THRESHOLDS = {'xyra': {}, 'shoptik': {}, 'shopee': {'lokasi_khusus': 'jakarta'}}
+EXPORT_EXTENSIONS = [ext for ext, _ in EXPORT_FORMATS.values()]
+
+
+def run_once(mode, paths, export_ext, workers):
+    """Satu putaran pipeline + ekspor; mengembalikan (hasil run_pipeline, record Profiler)."""
+    profiler = Profiler()
+    with tempfile.TemporaryDirectory() as index_dir, \
+            ThreadPoolExecutor(max_workers=workers) as executor:
+        tracker = LinkTracker(mode, batch='bench', path=os.path.join(index_dir, 'links.sqlite'))
+        started = time.perf_counter()
+        result = run_pipeline(mode, paths, BENCH_THRESHOLDS[mode], tracker, executor, profiler=profiler)
+        df = result['combined_df']
+        for positions in (result['passed_rows'], result['removed_rows']):
+            build_export(df, positions, export_columns(df), export_ext, profiler).close()
+        profiler.add('total', time.perf_counter() - started)
+    return result, profiler.records()
+
+
+def bench_case(mode, paths, repeat, export_ext, workers):
+    seconds = {}
+    for _ in range(repeat):
+        result, records = run_once(mode, paths, export_ext, workers)
+        for record in records:
+            seconds.setdefault(record['stage'], []).append(record['seconds'])
+
+    # Sampah siklik dari putaran sebelumnya dibersihkan dulu agar tidak ikut terhitung di puncak secara acak
+    gc.collect()
+    tracemalloc.start()
+    try:
+        _, traced = run_once(mode, paths, export_ext, workers)
+    finally:
+        tracemalloc.stop()
+    peaks = {record['stage']: record['peak_bytes'] or 0 for record in traced}
+
+    return {
+        'unique_rows': result['unique_rows'],
+        'passed': int(result['passed'].sum()),
+        'stages': {stage: {'seconds': statistics.median(values), 'peak_bytes': peaks.get(stage, 0)}
+                   for stage, values in seconds.items()},
+    }
+
+
+def find_regressions(results, baseline, time_tolerance, memory_tolerance, time_floor, memory_floor):
+    # Regresi jika selisih melewati toleransi relatif dan juga batas absolut
+    regressions = []
+    for case, result in results.items():
+        for stage, measured in result['stages'].items():
+            expected = baseline.get(case, {}).get('stages', {}).get(stage)
+            if expected is None:
+                continue
+            slower = measured['seconds'] - expected['seconds']
+            if slower > time_floor and slower > expected['seconds'] * time_tolerance:
+                regressions.append(f"{case} {stage}: {expected['seconds']:.3f}s -> {measured['seconds']:.3f}s")
+            grown = measured['peak_bytes'] - expected['peak_bytes']
+            if grown > memory_floor and grown > expected['peak_bytes'] * memory_tolerance:
+                regressions.append(f"{case} {stage}: {expected['peak_bytes'] / 2**20:.1f} MiB -> "
+                                   f"{measured['peak_bytes'] / 2**20:.1f} MiB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--modes', nargs='+', choices=list(MODES), default=list(MODES))
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--files', type=int, default=2, help="Jumlah file per kasus (duplikat lintas file ikut diuji)")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--format', default='csv', choices=EXPORT_EXTENSIONS)
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Thread pembaca file (app memakai hingga MAX_WORKERS)")
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'filter-produk-bench'),
+                        help="Lokasi file sintetis; dipakai ulang antar run")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help="Simpan hasil run ini sebagai baseline baru")
+    parser.add_argument('--time-tolerance', type=float, default=0.25)
+    parser.add_argument('--memory-tolerance', type=float, default=0.10)
+    parser.add_argument('--time-floor', type=float, default=0.1,
+                        help="Selisih waktu minimal (detik) agar dihitung regresi")
+    parser.add_argument('--memory-floor', type=float, default=4,
+                        help="Selisih memori puncak minimal (MiB) agar dihitung regresi")
+    args = parser.parse_args()
+
+    results = {}
+    for mode in args.modes:
+        for rows in args.rows:
+            paths = write_exports(mode, rows, args.files, args.data_dir)
+            case = f"{mode}:{rows}:{args.files}:{args.format}"
+            results[case] = result = bench_case(mode, paths, args.repeat, args.format, args.workers)
+            print(f"{case}  unik={result['unique_rows']} lolos={result['passed']}")
+            for stage, measured in result['stages'].items():
+                print(f"    {stage:<30} {measured['seconds']:8.3f}s {measured['peak_bytes'] / 2**20:8.1f} MiB")
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"Baseline disimpan: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Baseline {args.baseline} belum ada; jalankan dengan --save-baseline dulu.")
+        return 1
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = find_regressions(results, baseline, args.time_tolerance, args.memory_tolerance,
+                                   args.time_floor, args.memory_floor * 2**20)
+    missing = [case for case in results if case not in baseline]
+    for case in missing:
+        print(f"Kasus {case} belum ada di baseline; jalankan dengan --save-baseline dulu.")
+    for regression in regressions:
+        print(f"REGRESI {regression}")
+    return 1 if regressions or missing else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""Ukur waktu impor dan latensi rerun app Streamlit.
+
+Impor: setiap modul diimpor di proses Python baru (--repeat kali, diambil
+median), lalu `python -X importtime` dipakai untuk daftar modul paling
+lambat dan untuk memeriksa bahwa pustaka berat (plotly, matplotlib,
+openpyxl, telegram, pyarrow.parquet/feather) belum dimuat saat halaman
+pertama tampil.
+
+Rerun: app dijalankan dengan `streamlit.testing.v1.AppTest` (di proses
+ini, sama seperti server: modul dan cache_resource tetap hidup antar
+rerun). Satu widget sidebar diubah --reruns kali dan waktu setiap rerun
+dicatat; pindah mode diukur terpisah (impor modul mode pertama kali).
+--rev membandingkan app.py dari commit lain, mis. sebelum app dipecah.
+
+Contoh:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --reruns 50 --rev HEAD~1
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+IMPORT_TARGETS = ['streamlit', 'shopee_filter.modes', 'ui.common', 'ui.xyra', 'ui.shoptik', 'ui.shopee']
+DEFERRED_MODULES = ['plotly', 'matplotlib', 'openpyxl', 'telegram', 'pyarrow.parquet', 'pyarrow.feather']
+
+
+def import_seconds(module, repeat):
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    runs = [float(subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                                 capture_output=True, text=True).stdout) for _ in range(repeat)]
+    return statistics.median(runs)
+
+
+def import_profile(modules):
+    """Jalankan `-X importtime` untuk `modules`; hasilnya {modul: detik kumulatif}."""
+    code = '; '.join(f"import {module}" for module in modules)
+    stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stderr
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cum, name = line[len('import time:'):].split('|')
+        cumulative[name.strip()] = int(cum) / 1e6
+    return cumulative
+
+
+def bench_imports(repeat, top):
+    print("== Waktu impor (proses baru, median) ==")
+    for module in IMPORT_TARGETS:
+        print(f"{module:<22} {import_seconds(module, repeat) * 1000:8.1f} ms")
+
+    # Yang diimpor app.py + halaman mode pertama, yaitu semua yang dibutuhkan tampilan awal
+    first_page = ['streamlit', 'shopee_filter.modes', 'ui.xyra']
+    cumulative = import_profile(first_page)
+    print(f"\n== {top} modul paling lambat untuk halaman pertama (kumulatif) ==")
+    for name, seconds in sorted(cumulative.items(), key=lambda item: -item[1])[:top]:
+        print(f"{name:<40} {seconds * 1000:8.1f} ms")
+    print("\n== Pustaka berat ==")
+    for module in DEFERRED_MODULES:
+        print(f"{module:<22} {'dimuat' if module in cumulative else 'ditunda'}")
+
+
+def app_file(rev):
+    if rev is None:
+        return os.path.join(ROOT, 'app.py'), None
+    # Disimpan di root repo agar style.css dan paket lokal ditemukan seperti app.py asli
+    path = os.path.join(ROOT, f".bench_app_{rev.replace('/', '_').replace('~', '_')}.py")
+    source = subprocess.run(['git', 'show', f"{rev}:app.py"], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    with open(path, 'w') as f:
+        f.write(source)
+    return path, path
+
+
+def timed_run(at, action=None):
+    started = time.perf_counter()
+    (action(at) if action else at).run()
+    elapsed = time.perf_counter() - started
+    if at.exception:
+        raise RuntimeError(f"App gagal dijalankan: {at.exception[0].message}")
+    return elapsed
+
+
+def bench_reruns(rev, reruns, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    path, cleanup = app_file(rev)
+    os.chdir(ROOT)
+    try:
+        at = AppTest.from_file(path, default_timeout=timeout)
+        first = timed_run(at)
+        # Widget yang diubah: input angka pertama di sidebar (batas minimal stok di mode Xyra)
+        tweaks = [timed_run(at, lambda at, i=i: at.sidebar.number_input[0].set_value(11 + i % 2))
+                  for i in range(reruns)]
+        labels = at.sidebar.selectbox[0].options
+        switches = {label: timed_run(at, lambda at, label=label: at.sidebar.selectbox[0].set_value(label))
+                    for label in labels[1:]}
+    finally:
+        if cleanup:
+            os.remove(cleanup)
+
+    print(f"== Rerun app ({rev or 'working tree'}) ==")
+    print(f"run pertama          {first * 1000:8.1f} ms")
+    print(f"ubah widget median   {statistics.median(tweaks) * 1000:8.1f} ms")
+    print(f"ubah widget p95      {sorted(tweaks)[int(len(tweaks) * 0.95) - 1] * 1000:8.1f} ms")
+    for label, seconds in switches.items():
+        print(f"pindah ke {label:<34} {seconds * 1000:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help="Jumlah proses baru per modul untuk waktu impor")
+    parser.add_argument('--top', type=int, default=15, help="Jumlah modul paling lambat yang ditampilkan")
+    parser.add_argument('--reruns', type=int, default=20, help="Jumlah rerun saat mengubah widget")
+    parser.add_argument('--timeout', type=float, default=30, help="Batas waktu satu run AppTest (detik)")
+    parser.add_argument('--rev', help="Ukur juga app.py dari commit ini untuk perbandingan")
+    parser.add_argument('--skip-imports', action='store_true')
+    args = parser.parse_args()
+
+    if not args.skip_imports:
+        bench_imports(args.repeat, args.top)
+        print()
+    bench_reruns(None, args.reruns, args.timeout)
+    if args.rev:
+        print()
+        bench_reruns(args.rev, args.reruns, args.timeout)
+
+
+if __name__ == '__main__':
+    main()
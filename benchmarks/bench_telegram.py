@@ -0,0 +1,122 @@
+"""Kirim produk sintetis lewat `TelegramSender` ke server Bot API tiruan di localhost.
+
+Server tiruan menjawab sendMessage/sendDocument seperti Telegram dan
+membalas HTTP 429 (retry_after) jika kiriman melebihi --server-rate per
+detik, jadi antrean, batching, rate limit, dan backoff bisa dicoba tanpa
+token asli dan tanpa internet.
+
+Contoh:
+    python benchmarks/bench_telegram.py --products 20000 --per-minute 600 --server-rate 5
+    python benchmarks/bench_telegram.py --serve --port 8081   # hanya jalankan server tiruan
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from shopee_filter.telegram_delivery import TelegramSender, product_files, product_messages  # noqa: E402
+
+FAKE_TOKEN = '123456:stub-token'
+
+
+class StubBotApi(BaseHTTPRequestHandler):
+    rate = None  # kiriman per detik sebelum dibalas 429; None = tanpa batas
+    counts = {'sendMessage': 0, 'sendDocument': 0, '429': 0}
+    lock = threading.Lock()
+    window = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        method = self.path.rsplit('/', 1)[-1]
+        now = time.monotonic()
+        with self.lock:
+            self.window[:] = [at for at in self.window if now - at < 1]
+            limited = self.rate is not None and len(self.window) >= self.rate
+            if limited:
+                self.counts['429'] += 1
+            else:
+                self.window.append(now)
+                self.counts[method] = self.counts.get(method, 0) + 1
+                message_id = sum(self.counts.values())
+        if limited:
+            self.reply(429, {'ok': False, 'error_code': 429, 'description': 'Too Many Requests: retry after 1',
+                             'parameters': {'retry_after': 1}})
+        else:
+            self.reply(200, {'ok': True, 'result': {'message_id': message_id, 'date': int(time.time()),
+                                                    'chat': {'id': -100, 'type': 'channel'}}})
+
+    def reply(self, status, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def make_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Harga': rng.integers(5_000, 2_500_000, rows).astype('float64'),
+        'Komisi(Rp)': rng.uniform(500, 5_000, rows).round(0).astype('float32'),
+        'Terjual(Bulanan)': rng.integers(5, 100, rows).astype('int32'),
+        'Link Produk': [f"https://shopee.co.id/Produk-i.{i // 37}.{i}" for i in range(rows)],
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=5_000)
+    parser.add_argument('--files', action='store_true', help="Kirim sebagai file CSV, bukan pesan")
+    parser.add_argument('--per-minute', type=int, default=600, help="messages_per_minute untuk pengirim")
+    parser.add_argument('--server-rate', type=int, help="Batas kiriman per detik di server tiruan (memicu 429)")
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--port', type=int, default=0)
+    parser.add_argument('--serve', action='store_true', help="Hanya jalankan server tiruan sampai Ctrl+C")
+    args = parser.parse_args()
+
+    StubBotApi.rate = args.server_rate
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), StubBotApi)
+    base_url = f"http://127.0.0.1:{server.server_port}/bot"
+    if args.serve:
+        print(f"Server tiruan di {base_url}<token>/... (isi [telegram] base_url di secrets)")
+        server.serve_forever()
+        return
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    df = make_frame(args.products)
+    positions = np.arange(len(df))
+    if args.files:
+        items = product_files(df, positions, list(df.columns), 'produk')
+    else:
+        items = product_messages(df, positions, ['Harga', 'Komisi(Rp)', 'Terjual(Bulanan)'], 'Link Produk')
+
+    sender = TelegramSender(FAKE_TOKEN, -100, base_url=base_url, messages_per_minute=args.per_minute,
+                            workers=args.workers)
+    started = time.perf_counter()
+    job = sender.submit(items)
+    while not (progress := job.progress())['done']:
+        print(f"\rterkirim {progress['sent']}/{progress['queued']}  gagal {progress['failed']}", end='')
+        time.sleep(0.5)
+    elapsed = time.perf_counter() - started
+    server.shutdown()
+
+    print(f"\rterkirim {progress['sent']}/{progress['queued']}  gagal {progress['failed']}  "
+          f"{elapsed:.1f}s  ({progress['sent'] / elapsed:.1f} kiriman/detik)")
+    print(f"server: {StubBotApi.counts}")
+    for error in progress['errors']:
+        print(f"galat: {error}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""Tulis file export sintetis dengan susunan kolom persis seperti tiap mode.
+
+Contoh:
+    python benchmarks/synthetic.py --mode shopee --rows 1000000 --files 2 --out /tmp/export
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+WRITE_CHUNK_ROWS = 250_000
+DUPLICATE_RATE = 0.05  # bagian baris yang link-nya menunjuk produk lain (di file yang sama atau sebelumnya)
+CITIES = np.array(['KOTA JAKARTA BARAT', 'KOTA JAKARTA SELATAN', 'KAB. BANDUNG', 'KOTA SURABAYA',
+                   'KOTA MEDAN', 'KAB. SLEMAN', 'KOTA SEMARANG', 'KOTA DENPASAR', 'KAB. TANGERANG'])
+SHOPEE_LOKAL_RENAMED = {
+    'Harga': 'Harga Produk',
+    'Stock': 'Stok Barang',
+    'Terjual Bulanan': 'Penjualan Bulanan',
+    'Rating': 'Rating Toko',
+    'Lokasi Toko': 'Lokasi',
+    'Link Produk': 'Link',
+}
+
+
+def product_ids(rng, start, rows):
+    ids = np.arange(start, start + rows)
+    dupes = rng.random(rows) < DUPLICATE_RATE
+    ids[dupes] = rng.integers(0, start + rows, int(np.count_nonzero(dupes)))
+    return ids
+
+
+def text(prefix, values):
+    return np.char.add(prefix, values.astype(str))
+
+
+def shopee_links(ids):
+    # Bentuk link Shopee asli: ".../Nama-Produk-i.<shopid>.<itemid>"
+    shops = ids // 37 + 10_000
+    return np.char.add(np.char.add(text('https://shopee.co.id/Produk-Sintetis-', ids), text('-i.', shops)),
+                       text('.', ids * 7 + 1))
+
+
+def xyra_chunk(rng, ids):
+    rows = len(ids)
+    harga = rng.integers(5_000, 2_500_000, rows)
+    komisi_persen = rng.uniform(0, 15, rows).round(1)
+    return pd.DataFrame({
+        'Nama Produk': text('Produk Xyra ', ids),
+        'Link Produk': shopee_links(ids),
+        'Harga': text('Rp', harga),
+        'Stock': rng.integers(0, 5_000, rows),
+        'Terjual(Bulanan)': rng.integers(0, 300, rows),
+        'Komisi(%)': np.char.add(komisi_persen.astype(str), '%'),
+        'Komisi(Rp)': (harga * komisi_persen / 100).round(0),
+        'Jumlah Live': rng.integers(0, 20, rows),
+        'Nama Toko': text('Toko ', ids // 37),
+    })
+
+
+def shoptik_chunk(rng, ids):
+    rows = len(ids)
+    return pd.DataFrame({
+        'productName': text('Produk Shoptik ', ids),
+        'productLink': shopee_links(ids),
+        'trendPercentage': np.char.add(rng.uniform(-50, 400, rows).round(1).astype(str), '%'),
+        'Harga': text('Rp', rng.integers(5_000, 2_500_000, rows)),
+        'Penjualan (30 Hari)': rng.integers(0, 10_000, rows),
+        'Stok': rng.integers(0, 5_000, rows),
+        'Peringkat': np.char.replace(rng.uniform(3, 5, rows).round(1).astype(str), '.', ','),
+        'isAd': rng.choice(['True', 'False'], rows, p=[0.2, 0.8]),
+        'shopName': text('Toko ', ids // 37),
+    })
+
+
+def shopee_chunk(rng, ids):
+    rows = len(ids)
+    return pd.DataFrame({
+        'No': np.arange(1, rows + 1),
+        'Nama Produk': text('Produk Lokal ', ids),
+        'Harga': text('Rp', rng.integers(5_000, 2_500_000, rows)),
+        'Stock': rng.integers(0, 5_000, rows),
+        'Terjual Bulanan': rng.integers(0, 1_000, rows),
+        'Rating': rng.uniform(3, 5, rows).round(1),
+        'Lokasi Toko': rng.choice(CITIES, rows),
+        'Flash Sale': rng.choice(['TRUE', 'FALSE'], rows, p=[0.1, 0.9]),
+        'Link Produk': shopee_links(ids),
+    })
+
+
+def file_layout(mode, index):
+    """(pembuat chunk, delimiter, ekstensi, nama kolom pengganti) untuk file ke-`index`.
+
+    Toko Lokal berselang-seling antara CSV berkolom standar dan TXT bertab
+    dengan nama kolom lama yang diubah oleh `rename_columns_smart`.
+    """
+    if mode == 'xyra':
+        return xyra_chunk, '\t', 'txt', None
+    if mode == 'shoptik':
+        return shoptik_chunk, ',', 'csv', None
+    if index % 2:
+        return shopee_chunk, '\t', 'txt', SHOPEE_LOKAL_RENAMED
+    return shopee_chunk, ',', 'csv', None
+
+
+def write_exports(mode, rows, files, out_dir, seed=0):
+    """Tulis `rows` baris dibagi ke `files` file; mengembalikan daftar path.
+
+    File ditulis per chunk supaya ukuran jutaan baris tidak perlu muat di RAM.
+    File yang sudah ada dengan nama sama dipakai ulang.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    paths, start = [], 0
+    per_file = -(-rows // files)
+    for index in range(files):
+        make_chunk, delimiter, ext, rename = file_layout(mode, index)
+        count = min(per_file, rows - start)
+        path = os.path.join(out_dir, f"{mode}_{rows}_{seed}_{index}.{ext}")
+        paths.append(path)
+        if os.path.exists(path):
+            start += count
+            continue
+        partial_path = path + '.part'
+        for offset in range(0, count, WRITE_CHUNK_ROWS):
+            ids = product_ids(rng, start + offset, min(WRITE_CHUNK_ROWS, count - offset))
+            chunk = make_chunk(rng, ids)
+            if rename:
+                chunk.rename(columns=rename, inplace=True)
+            chunk.to_csv(partial_path, sep=delimiter, index=False, header=offset == 0,
+                         mode='w' if offset == 0 else 'a')
+        os.replace(partial_path, path)
+        start += count
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--mode', choices=['xyra', 'shoptik', 'shopee'], required=True)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--files', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default='benchmark-data')
+    args = parser.parse_args()
+
+    for path in write_exports(args.mode, args.rows, args.files, args.out, args.seed):
+        print(path)
+
+
+if __name__ == '__main__':
+    main()
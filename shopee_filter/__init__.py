@@ -0,0 +1,18 @@
+"""Inti filter produk (baca, bersihkan, filter, ekspor) yang bisa dipakai tanpa Streamlit."""
+from .exporter import EXPORT_FORMATS, write_export
+from .filter_engine import clause, evaluate_filters, partition_rows, range_clauses
+from .link_store import LinkTracker
+from .loader import SOURCE_COL, export_columns, load_files
+from .modes import MODES, resolve_thresholds
+from .pipeline import filter_mode, load_mode, run_pipeline
+from .profiling import Profiler
+
+__all__ = [
+    'EXPORT_FORMATS', 'write_export',
+    'clause', 'evaluate_filters', 'partition_rows', 'range_clauses',
+    'LinkTracker',
+    'SOURCE_COL', 'export_columns', 'load_files',
+    'MODES', 'resolve_thresholds',
+    'filter_mode', 'load_mode', 'run_pipeline',
+    'Profiler',
+]
@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# === KERNEL PEMBERSIH KOLOM ANGKA ===
+# kind:
+#   'number'   : angka biasa ("12", "3.5")
+#   'currency' : buang semua karakter selain digit dan titik ("Rp12000" -> 12000)
+#   'percent'  : buang tanda persen ("7.5%" -> 7.5)
+#   'rating'   : koma jadi titik lalu ambil angka pertama ("4,8 / 5" -> 4.8)
+INT32_MAX = np.iinfo(np.int32).max
+
+
+def to_arrow_strings(series):
+    try:
+        return pa.array(series.to_numpy(dtype=object), type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Kolom campuran (angka dan teks) baru diubah ke str kalau memang perlu
+        return pa.array(series.astype(str).to_numpy(dtype=object), type=pa.string(), from_pandas=True)
+
+
+def parse_numeric_strings(series, kind):
+    arr = to_arrow_strings(series)
+    if kind == 'currency':
+        arr = pc.replace_substring_regex(arr, pattern=r'[^0-9.]', replacement='')
+    elif kind == 'percent':
+        arr = pc.replace_substring(arr, pattern='%', replacement='')
+    elif kind == 'rating':
+        arr = pc.replace_substring(arr, pattern=',', replacement='.')
+        arr = pc.extract_regex(arr, pattern=r'(?P<value>\d+\.?\d*)').flatten()[0]
+    values = pd.to_numeric(arr.to_numpy(zero_copy_only=False), errors='coerce')
+    return pd.Series(values, index=series.index)
+
+
+def to_compact_dtype(values, dtype):
+    # int32 hanya jika semua nilai bulat, tidak kosong, dan muat; selain itu float32
+    if dtype == 'int32':
+        if (not values.hasnans and (values % 1 == 0).all()
+                and (values.empty or values.abs().max() <= INT32_MAX)):
+            return values.astype('int32')
+        return values.astype('float32')
+    return values.astype(dtype)
+
+
+def clean_numeric(series, kind='number', dtype='float32', fill=0):
+    # Kolom yang sudah angka tidak diubah ke str; kolom teks diparse sekali lewat pyarrow.compute.
+    # fill=None membiarkan nilai yang gagal diparse tetap NaN
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        values = series
+    elif kind == 'number':
+        values = pd.to_numeric(series, errors='coerce')
+    else:
+        values = parse_numeric_strings(series, kind)
+
+    if fill is not None:
+        values = values.fillna(fill)
+    return to_compact_dtype(values, dtype)
+
+
+def clean_columns(df, columns, fill=0):
+    # columns: {nama kolom: (kind, dtype)}; kolom yang tidak ada dilewati
+    for col, (kind, dtype) in columns.items():
+        if col in df.columns:
+            df[col] = clean_numeric(df[col], kind, dtype, fill)
+    return df
+
+
+def clean_flag(series, pattern):
+    # Kolom yang sudah boolean (hasil parse "True"/"False" oleh pandas) tidak diubah ke str
+    if pd.api.types.is_bool_dtype(series):
+        return series
+    return series.astype(str).str.contains(pattern, case=False, na=False)
+
+
+# === DTYPE RINGKAS UNTUK KOLOM TEKS ===
+# Kolom teks dengan nilai unik <= rasio ini dari jumlah baris dijadikan category
+CATEGORY_MAX_RATIO = 0.5
+
+
+def compact_numeric(df, numeric_cols):
+    # Tiap chunk memilih int32/float32 sendiri, dan gabungan int32 + float32 menjadi
+    # float64; dtype ringkas dipilih ulang sekali untuk seluruh kolom gabungan
+    for col, (_, dtype) in numeric_cols.items():
+        if col in df.columns and dtype != 'float64' and df[col].dtype == 'float64':
+            df[col] = to_compact_dtype(df[col], dtype)
+    return df
+
+
+def compact_frame(df, category_cols=(), numeric_cols=None):
+    # Teks bernilai unik sedikit (dan category_cols) jadi category, teks lain jadi string berbasis Arrow;
+    # kolom numeric_cols ({kolom: (kind, dtype)}) dikembalikan ke dtype ringkas setelah chunk digabung
+    if numeric_cols:
+        compact_numeric(df, numeric_cols)
+    for col in df.columns:
+        series = df[col]
+        if series.dtype != object:
+            continue
+        if col in category_cols or series.nunique() <= len(series) * CATEGORY_MAX_RATIO:
+            df[col] = series.astype('category')
+        else:
+            df[col] = series.astype('string[pyarrow]')
+    return df
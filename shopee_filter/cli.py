@@ -0,0 +1,174 @@
+"""Jalankan filter produk tanpa UI, misalnya dari cron atau CI.
+
+Contoh:
+    shopee-filter run --mode xyra --config batas.toml --output-dir hasil export/*.txt
+"""
+import argparse
+import glob
+import hashlib
+import logging
+import os
+import sys
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from .exporter import EXPORT_FORMATS, write_export
+from .link_store import LinkTracker
+from .loader import MAX_WORKERS, export_columns
+from .modes import MODES
+from .pipeline import run_pipeline
+from .profiling import LOG_PATH, TRACE_MEMORY, Profiler, write_log
+from .ranking import ranking
+
+EXPORT_EXTENSIONS = {ext: label for label, (ext, _) in EXPORT_FORMATS.items()}
+
+
+def load_config(path, mode):
+    # Batas filter per mode ([xyra], [shoptik], [shopee]) atau di tingkat atas, peringkat di sub-tabel ranking.
+    # Hasilnya (batas, peringkat atau None)
+    try:
+        import tomllib
+    except ModuleNotFoundError:  # Python < 3.11
+        import tomli as tomllib
+
+    with open(path, 'rb') as f:
+        config = tomllib.load(f)
+    thresholds = dict(config[mode]) if mode in config else {
+        key: value for key, value in config.items() if key not in MODES
+    }
+    options = thresholds.pop('ranking', None)
+    return thresholds, (ranking(**options) if options else None)
+
+
+def expand_inputs(patterns):
+    # Pola glob ikut diperluas di sini karena shell Windows tidak melakukannya
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        paths.extend(matches)
+    return paths
+
+
+def path_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(2**20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def print_profile(records):
+    print(f"{'Tahap':<32} {'Panggilan':>9} {'Detik':>9} {'Masuk':>10} {'Keluar':>10} {'Memori puncak':>14}")
+    for record in records:
+        peak = f"{record['peak_bytes'] / 2**20:.1f} MiB" if record['peak_bytes'] is not None else '-'
+        rows_in = record['rows_in'] if record['rows_in'] is not None else '-'
+        rows_out = record['rows_out'] if record['rows_out'] is not None else '-'
+        print(f"{record['stage']:<32} {record['calls']:>9} {record['seconds']:>9.3f} "
+              f"{rows_in:>10} {rows_out:>10} {peak:>14}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='shopee-filter', description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="Filter file export dan tulis hasilnya ke disk")
+    run.add_argument('inputs', nargs='+', help="File export (boleh pola glob)")
+    run.add_argument('--mode', choices=list(MODES), required=True)
+    run.add_argument('--config', help="File TOML berisi batas filter; batas yang tidak diisi memakai default UI")
+    run.add_argument('--output-dir', default='.')
+    run.add_argument('--prefix', help="Awalan nama file hasil (default: nama mode)")
+    run.add_argument('--format', choices=list(EXPORT_EXTENSIONS), default='csv')
+    run.add_argument('--workers', type=int, default=MAX_WORKERS,
+                     help="Jumlah proses pembaca file (default: %(default)s)")
+    run.add_argument('--skip-seen', action=argparse.BooleanOptionalAction, default=True,
+                     help="Lewati produk yang sudah pernah diproses (default: ya)")
+    run.add_argument('--shuffle', action='store_true', help="Acak urutan produk")
+    run.add_argument('--seed', type=int, help="Seed untuk --shuffle agar urutan bisa diulang")
+    run.add_argument('--top', type=int, help="Ambil hanya N produk lolos dengan skor tertinggi")
+    run.add_argument('--score', help="Label skor bawaan mode atau rumus pandas.eval, mis. \"`Komisi(Rp)` * `Terjual(Bulanan)`\"")
+    run.add_argument('--cap-by', help="Kolom grup untuk --per-group, mis. \"Lokasi Toko\" atau \"Toko (dari link)\"")
+    run.add_argument('--per-group', type=int, help="Maksimal produk per grup di peringkat")
+    run.add_argument('--profile', action='store_true', help="Cetak waktu dan memori tiap tahap")
+    run.add_argument('--profile-log', default=LOG_PATH,
+                     help="Tambahkan profil sebagai satu baris JSON ke file ini (default: $PROFILE_LOG_PATH)")
+    run.add_argument('--trace-memory', action='store_true', default=TRACE_MEMORY,
+                     help="Ukur memori puncak per tahap dengan tracemalloc (lebih lambat)")
+    return parser
+
+
+def run(args):
+    thresholds, rank_options = load_config(args.config, args.mode) if args.config else ({}, None)
+    if args.top or args.score or args.cap_by or args.per_group:
+        base = rank_options or ranking(next(iter(MODES[args.mode]['scores'])), None)
+        rank_options = ranking(args.score or base['score'], args.top or base['top_n'],
+                               args.cap_by or base['group'], args.per_group or base['per_group'])
+    if rank_options and not rank_options['top_n']:
+        print("Peringkat butuh jumlah produk (--top atau ranking.top_n).", file=sys.stderr)
+        return 2
+    sources = expand_inputs(args.inputs)
+    missing = [path for path in sources if not os.path.isfile(path)]
+    if missing:
+        print(f"File tidak ditemukan: {', '.join(missing)}", file=sys.stderr)
+        return 2
+
+    profiler = Profiler()
+    if args.trace_memory:
+        tracemalloc.start()
+    # Digest diurutkan agar file yang sama dalam urutan lain tetap dianggap batch yang sama
+    tracker = LinkTracker(args.mode, batch=''.join(sorted(path_digest(path) for path in sources)),
+                          skip_seen=args.skip_seen)
+    workers = max(1, min(args.workers, len(sources)))
+    # Proses pekerja perlu menyalakan tracemalloc sendiri agar memori tahap baca file ikut terukur
+    initializer = tracemalloc.start if args.trace_memory else None
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=initializer) as pool:
+            result = run_pipeline(args.mode, sources, thresholds, tracker, pool, shuffle=args.shuffle,
+                                  seed=args.seed, profiler=profiler, ranking=rank_options)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    if result is None:
+        print("Gagal memproses data karena kolom penting tidak ditemukan.", file=sys.stderr)
+        return 1
+    for error in result['errors']:
+        print(error, file=sys.stderr)
+
+    df = result['combined_df']
+    columns = export_columns(df)
+    prefix = args.prefix or args.mode
+    os.makedirs(args.output_dir, exist_ok=True)
+    outputs = []
+    for part, positions in (('lolos', result['passed_rows']), ('sampah', result['removed_rows'])):
+        path = os.path.join(args.output_dir, f"{prefix}_{part}.{args.format}")
+        with open(path, 'wb') as f, profiler.span(f"ekspor {args.format}", rows_in=len(positions)):
+            write_export(df, positions, columns, args.format, f)
+        outputs.append(path)
+
+    links = result['links']
+    print(f"Total produk diproses: {result['total_rows']}")
+    print(f"Produk unik setelah hapus duplikat: {result['unique_rows']}")
+    print(f"Produk lolos filter: {int(result['passed'].sum())}")
+    if rank_options:
+        print(f"Produk masuk peringkat top-{rank_options['top_n']}: {len(result['passed_rows'])}")
+    print(f"Produk tidak lolos filter: {len(result['removed_rows'])}")
+    print(f"Duplikat yang dihapus: {result['deleted_dupes']}")
+    print(f"Produk baru: {links['new']}, berubah: {links['changed']}, "
+          f"sudah pernah diproses: {links['seen']} (dilewati: {links['skipped']})")
+    for path in outputs:
+        print(f"Ditulis: {path}")
+    if args.profile:
+        print_profile(profiler.records())
+    write_log(profiler.records(), args.profile_log, mode=args.mode, rows=result['total_rows'])
+    return 1 if result['errors'] else 0
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s: %(message)s')
+    args = build_parser().parse_args(argv)
+    if args.command == 'run':
+        return run(args)
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
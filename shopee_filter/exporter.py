@@ -0,0 +1,131 @@
+import gzip
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pandas as pd
+
+# === EKSPOR FILE DI LATAR BELAKANG ===
+# {label: (ekstensi, mime)}
+EXPORT_FORMATS = {
+    'CSV': ('csv', 'text/csv'),
+    'CSV (gzip)': ('csv.gz', 'application/gzip'),
+    'Parquet': ('parquet', 'application/vnd.apache.parquet'),
+    'Excel (XLSX)': ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+}
+EXPORT_CHUNK_ROWS = 50_000
+EXPORT_MAX_JOBS = 32
+# Di atas ini file ekspor dipindah dari RAM ke disk; semua job yang disimpan
+# paling banyak memakai EXPORT_MAX_JOBS * SPOOL_MAX_BYTES (128 MiB) RAM per server
+SPOOL_MAX_BYTES = 4 * 2**20
+XLSX_MAX_ROWS = 1_048_575  # batas baris Excel dikurangi satu baris header
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='export')
+_jobs = OrderedDict()
+_jobs_lock = threading.Lock()
+
+
+def iter_row_chunks(df, positions, columns):
+    for start in range(0, len(positions), EXPORT_CHUNK_ROWS):
+        yield df.take(positions[start:start + EXPORT_CHUNK_ROWS])[columns]
+
+
+def write_csv(df, positions, columns, raw):
+    raw.write(df.head(0)[columns].to_csv(index=False).encode('utf-8'))
+    for chunk in iter_row_chunks(df, positions, columns):
+        raw.write(chunk.to_csv(index=False, header=False).encode('utf-8'))
+
+
+def write_parquet(df, positions, columns, raw):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.Schema.from_pandas(df.head(0)[columns], preserve_index=False)
+    with pq.ParquetWriter(raw, schema) as writer:
+        for chunk in iter_row_chunks(df, positions, columns):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def write_xlsx(df, positions, columns, raw):
+    if len(positions) > XLSX_MAX_ROWS:
+        raise ValueError(f"Excel hanya menampung {XLSX_MAX_ROWS} baris; gunakan CSV atau Parquet.")
+    with pd.ExcelWriter(raw, engine='openpyxl') as writer:
+        df.head(0)[columns].to_excel(writer, index=False)
+        row = 1
+        for chunk in iter_row_chunks(df, positions, columns):
+            chunk.to_excel(writer, index=False, header=False, startrow=row)
+            row += len(chunk)
+
+
+def write_export(df, positions, columns, ext, raw):
+    # `raw` cukup objek file biner; dipakai UI (SpooledTemporaryFile) dan CLI (file di disk)
+    if ext == 'csv':
+        write_csv(df, positions, columns, raw)
+    elif ext == 'csv.gz':
+        with gzip.GzipFile(fileobj=raw, mode='wb') as compressed:
+            write_csv(df, positions, columns, compressed)
+    elif ext == 'parquet':
+        write_parquet(df, positions, columns, raw)
+    else:
+        write_xlsx(df, positions, columns, raw)
+
+
+def build_export(df, positions, columns, ext, profiler=None):
+    spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    if profiler is None:
+        write_export(df, positions, columns, ext, spooled)
+    else:
+        with profiler.span(f"ekspor {ext}", rows_in=len(positions)):
+            write_export(df, positions, columns, ext, spooled)
+    return spooled
+
+
+def forget_failed(key, job, future):
+    # Job yang gagal dibuang agar permintaan berikutnya bisa mencoba ulang
+    if future.exception() is not None:
+        with _jobs_lock:
+            if _jobs.get(key) is job:
+                del _jobs[key]
+
+
+def find_export(key, export_format):
+    with _jobs_lock:
+        job = _jobs.get((key, export_format))
+        if job is not None:
+            _jobs.move_to_end((key, export_format))
+        return job
+
+
+def submit_export(key, df, positions, columns, export_format, profiler=None):
+    # Kunci sama berarti job yang sama dipakai ulang. Job yang tergeser dari daftar tidak ditutup paksa:
+    # file sementaranya ditutup saat tidak ada sesi yang masih memegangnya
+    ext = EXPORT_FORMATS[export_format][0]
+    key = (key, export_format)
+    with _jobs_lock:
+        job = _jobs.get(key)
+        if job is not None:
+            _jobs.move_to_end(key)
+            return job
+        job = (_executor.submit(build_export, df, positions, columns, ext, profiler), threading.Lock())
+        _jobs[key] = job
+        while len(_jobs) > EXPORT_MAX_JOBS:
+            _jobs.popitem(last=False)
+    # Di luar kunci: callback langsung dijalankan jika job sudah selesai
+    job[0].add_done_callback(partial(forget_failed, key, job))
+    return job
+
+
+def wait_export(job, timeout=None):
+    # Tunggu job selesai; galat saat membuat file diteruskan ke pemanggil
+    job[0].result(timeout=timeout)
+
+
+def read_export(job):
+    # Dipanggil tombol unduh sebagai callable, jadi file baru dibaca saat diklik, bukan setiap rerun
+    future, lock = job
+    spooled = future.result()
+    with lock:
+        spooled.seek(0)
+        return spooled.read()
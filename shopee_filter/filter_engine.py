@@ -0,0 +1,85 @@
+import numpy as np
+
+# === FILTER ENGINE ===
+FILTER_OPS = {'>=': np.greater_equal, '<=': np.less_equal}
+FILTER_SYMBOLS = {'>=': '≥', '<=': '≤'}
+
+
+def clause(column, op, value, optional=False):
+    # op: '>=' / '<=' (batas inklusif), 'contains' (teks, tanpa beda huruf besar/kecil), 'is_true'
+    # value None berarti klausa tidak dipakai; optional=True melewati klausa jika kolomnya tidak ada
+    return {'column': column, 'op': op, 'value': value, 'optional': optional}
+
+
+def range_clauses(column, min_value=None, max_value=None):
+    return [clause(column, '>=', min_value), clause(column, '<=', max_value)]
+
+
+def clause_label(c):
+    if c['op'] in FILTER_SYMBOLS:
+        return f"{c['column']} {FILTER_SYMBOLS[c['op']]} {c['value']}"
+    if c['op'] == 'contains':
+        return f"{c['column']} memuat '{c['value']}'"
+    return f"{c['column']} = True"
+
+
+def is_noop_clause(series, c):
+    # Batas yang tidak membatasi apa pun (mis. min=0 pada kolom tanpa nilai negatif) tidak perlu dievaluasi
+    if c['op'] not in FILTER_OPS or series.empty or series.hasnans:
+        return False
+    value = series.dtype.type(c['value']) if series.dtype.kind == 'f' else c['value']
+    if c['op'] == '>=':
+        return series.min() >= value
+    return series.max() <= value
+
+
+def evaluate_filters(df, spec):
+    # Semua klausa ditulis in-place ke satu mask; stats berisi jumlah baris yang ditolak tiap klausa
+    # (secara mandiri dan yang baru tersingkir di klausa itu)
+    mask = np.ones(len(df), dtype=bool)
+    scratch = np.empty(len(df), dtype=bool)
+    stats = []
+    for c in spec:
+        if c['value'] is None or c['value'] == '' or c['value'] is False:
+            continue
+        if c['optional'] and c['column'] not in df.columns:
+            continue
+        series = df[c['column']]
+        if is_noop_clause(series, c):
+            stats.append({'Klausa': clause_label(c), 'Status': 'dilewati',
+                          'Ditolak klausa ini': 0, 'Tersingkir di tahap ini': 0})
+            continue
+
+        if c['op'] in FILTER_OPS:
+            value = c['value']
+            if series.dtype.kind == 'f':
+                # Batas disamakan dengan dtype kolom agar rating 4.1 (float32) tetap lolos "≥ 4.1"
+                value = series.dtype.type(value)
+            FILTER_OPS[c['op']](series.to_numpy(), value, out=scratch)
+        elif c['op'] == 'contains':
+            scratch[:] = series.str.contains(c['value'], case=False, na=False).to_numpy(dtype=bool)
+        else:
+            scratch[:] = series.to_numpy(dtype=bool)
+
+        before = np.count_nonzero(mask)
+        np.logical_and(mask, scratch, out=mask)
+        stats.append({
+            'Klausa': clause_label(c),
+            'Status': 'aktif',
+            'Ditolak klausa ini': len(df) - int(np.count_nonzero(scratch)),
+            'Tersingkir di tahap ini': before - int(np.count_nonzero(mask)),
+        })
+    return mask, stats
+
+
+def partition_rows(mask, shuffle=False, seed=None):
+    # Satu argsort stabil atas mask (radix sort) memberi posisi (lolos, tidak lolos) dengan urutan asli;
+    # shuffle mengacak urutan di dalam masing-masing bagian, seed yang sama memberi urutan yang sama
+    order = np.argsort(mask, kind='stable')
+    removed_count = len(mask) - int(np.count_nonzero(mask))
+    passed, removed = order[removed_count:], order[:removed_count]
+    if shuffle:
+        rng = np.random.default_rng(seed)
+        passed, removed = rng.permutation(passed), rng.permutation(removed)
+    return passed, removed
+
@@ -0,0 +1,137 @@
+import hashlib
+import itertools
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# === INDEKS LINK PRODUK LINTAS SESI ===
+DEFAULT_PATH = os.environ.get(
+    'LINK_STORE_PATH',
+    os.path.join(os.path.expanduser('~'), '.cache', 'filter-produk', 'links.sqlite')
+)
+# Link Shopee berbentuk ".../Nama-Produk-i.<shopid>.<itemid>" atau ".../product/<shopid>/<itemid>"
+SHOPEE_ITEM_PATTERN = r'(?:-i\.|/product/)(\d+)[./](\d+)'
+# Sidik isi baris: nilai yang berbentuk angka di-hash sebagai float64
+NUMBER_PATTERN = r'^[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?$'
+HASH_MULTIPLIER = np.uint64(1_000_003)
+EMPTY_TEXT_HASH = pd.util.hash_array(np.array([''], dtype=object))[0]
+# Jumlah link per query IN (...); di bawah batas parameter SQLite versi lama (999)
+LOOKUP_BATCH = 900
+
+
+def normalize_links(links):
+    # Link Shopee jadi "shopee:<shopid>.<itemid>"; link lain dibuang query/fragment-nya (parameter tracking)
+    links = links.astype(str).str.strip()
+    ids = links.str.extract(SHOPEE_ITEM_PATTERN)
+    stripped = links.str.replace(r'[?#].*$', '', regex=True).str.rstrip('/').str.lower()
+    return ('shopee:' + ids[0] + '.' + ids[1]).fillna(stripped)
+
+
+def link_keys(links):
+    return pd.util.hash_pandas_object(normalize_links(links), index=False).to_numpy().view(np.int64)
+
+
+def value_hashes(values):
+    # Hash per nilai yang tidak bergantung dtype tebakan read_csv per chunk: 12, 12.0 dan "12" sama,
+    # teks dibandingkan tanpa spasi di tepi, sel kosong sama dengan NaN
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        numbers = values.to_numpy(dtype='float64', na_value=np.nan)
+        return pd.util.hash_array(numbers) * HASH_MULTIPLIER + EMPTY_TEXT_HASH
+    text = values.astype(str).str.strip().where(values.notna(), '').to_numpy(dtype=object)
+    # Hanya nilai yang berbentuk angka yang diparse; regex di pyarrow jauh lebih cepat
+    # daripada pd.to_numeric(errors='coerce') pada kolom teks biasa (nama, link)
+    looks_numeric = pc.match_substring_regex(pa.array(text, type=pa.string()), NUMBER_PATTERN)
+    looks_numeric = looks_numeric.to_numpy(zero_copy_only=False)
+    numbers = np.full(len(text), np.nan)
+    if looks_numeric.any():
+        numbers[looks_numeric] = pd.to_numeric(text[looks_numeric], errors='coerce')
+        text[looks_numeric] = ''
+    return pd.util.hash_array(numbers) * HASH_MULTIPLIER + pd.util.hash_array(text)
+
+
+def row_fingerprints(df, ignore_cols=()):
+    # Hash isi produk per baris (tanpa ignore_cols); berbeda berarti harga, stok, dst. berubah
+    hashes = np.zeros(len(df), dtype=np.uint64)
+    for col in df.columns:
+        if col not in ignore_cols:
+            hashes = hashes * HASH_MULTIPLIER + value_hashes(df[col])
+    return hashes.view(np.int64)
+
+
+def batch_key(batch):
+    return int.from_bytes(hashlib.blake2b(batch.encode('utf-8'), digest_size=8).digest(), 'little', signed=True)
+
+
+class LinkTracker:
+    # Indeks link per mode di SQLite; setiap chunk hanya mengambil entri untuk link di chunk itu
+    def __init__(self, mode, batch, skip_seen=True, path=DEFAULT_PATH):
+        self.mode = mode
+        self.batch = batch_key(batch)
+        self.skip_seen = skip_seen
+        self.path = path
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS seen_links ('
+            ' mode TEXT NOT NULL,'
+            ' link_hash INTEGER NOT NULL,'
+            ' fingerprint INTEGER NOT NULL,'
+            ' batch INTEGER NOT NULL,'
+            ' last_seen REAL NOT NULL,'
+            ' PRIMARY KEY (mode, link_hash)'
+            ') WITHOUT ROWID'
+        )
+        return conn
+
+    def _lookup(self, keys):
+        # Entri indeks untuk `keys` sebagai array terurut per link_hash, tanpa tuple per baris di memori
+        wanted = np.unique(keys)
+        parts = [np.empty(0, dtype=np.int64)]
+        with closing(self._connect()) as conn:
+            for start in range(0, len(wanted), LOOKUP_BATCH):
+                chunk_keys = wanted[start:start + LOOKUP_BATCH].tolist()
+                cursor = conn.execute(
+                    'SELECT link_hash, fingerprint, batch FROM seen_links '
+                    f"WHERE mode = ? AND link_hash IN ({', '.join('?' * len(chunk_keys))})",
+                    (self.mode, *chunk_keys)
+                )
+                parts.append(np.fromiter(itertools.chain.from_iterable(cursor), dtype=np.int64))
+        table = np.concatenate(parts).reshape(-1, 3)
+        table = table[np.argsort(table[:, 0])]
+        return table[:, 0], table[:, 1], table[:, 2]
+
+    def classify(self, df, link_col, ignore_cols=()):
+        # seen/changed: link sudah ada di indeks dengan isi sama/berbeda; skip: seen yang dicatat batch lain.
+        # Link yang dicatat batch ini tidak dilewati, agar memproses ulang file yang sama memberi hasil sama
+        keys = link_keys(df[link_col])
+        fingerprints = row_fingerprints(df, (link_col, *ignore_cols))
+        seen = np.zeros(len(df), dtype=bool)
+        changed = np.zeros(len(df), dtype=bool)
+        skip = np.zeros(len(df), dtype=bool)
+        known_keys, known_fingerprints, known_batches = self._lookup(keys)
+        if len(known_keys):
+            pos = np.minimum(np.searchsorted(known_keys, keys), len(known_keys) - 1)
+            known = known_keys[pos] == keys
+            same = known_fingerprints[pos] == fingerprints
+            seen = known & same
+            changed = known & ~same
+            skip = seen & (known_batches[pos] != self.batch)
+        return seen, changed, skip, keys, fingerprints
+
+    def record(self, keys, fingerprints):
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                'INSERT INTO seen_links (mode, link_hash, fingerprint, batch, last_seen) VALUES (?, ?, ?, ?, ?) '
+                'ON CONFLICT (mode, link_hash) DO UPDATE SET '
+                ' fingerprint = excluded.fingerprint, batch = excluded.batch, last_seen = excluded.last_seen',
+                ((self.mode, int(k), int(f), self.batch, now) for k, f in zip(keys, fingerprints))
+            )
@@ -0,0 +1,231 @@
+import os
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .cleaning import compact_frame
+from .profiling import Profiler, peak_rss_bytes
+
+# === BACA & GABUNGKAN FILE ===
+CHUNK_ROWS = 100_000
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+SOURCE_COL = 'Sumber File'
+# Kolom yang tidak ikut sidik isi produk: nomor urut bergeser setiap export
+FINGERPRINT_IGNORE_COLS = ('No', SOURCE_COL)
+
+
+def source_name(source):
+    # Sumber bisa berupa UploadedFile Streamlit, objek file biasa, atau path di disk
+    name = getattr(source, 'name', None)
+    return os.path.basename(name if isinstance(name, str) else str(source))
+
+
+def source_size(source):
+    size = getattr(source, 'size', None)
+    if size is not None:
+        return size
+    try:
+        return os.path.getsize(source)
+    except (OSError, TypeError):
+        return 0
+
+
+def export_columns(df):
+    # Kolom penanda file asal tidak ikut diekspor agar format CSV tetap sama seperti sumbernya
+    return [col for col in df.columns if col != SOURCE_COL]
+
+
+def ignore_warning(message):
+    # Dipakai untuk chunk kedua dst.: header sama dengan chunk pertama, jadi peringatannya juga sama
+    pass
+
+
+def iter_file_chunks(source, delimiter='\t', chunksize=CHUNK_ROWS):
+    # Baca langsung dari buffer byte (atau path) per chunk, tanpa decode seluruh isi file ke str
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    with pd.read_csv(source, delimiter=delimiter, on_bad_lines='skip',
+                     encoding='utf-8', chunksize=chunksize) as reader:
+        for chunk in reader:
+            yield chunk
+
+
+def load_file(source, delimiter, dedup_col, preprocess, tracker=None, chunksize=CHUNK_ROWS, rename=None):
+    # Dijalankan di pool pekerja: baca per chunk, hapus duplikat di dalam file,
+    # lewati produk yang sudah pernah diproses, lalu preprocessing.
+    # Profil dikumpulkan per file lalu digabung oleh pemanggil (bisa dari proses lain)
+    started = time.perf_counter()
+    profiler = Profiler()
+    parts, seen_links = [], set()
+    link_parts = {'keys': [], 'fingerprints': [], 'seen': [], 'changed': [], 'skip': []}
+    total_rows = chunks = peak_chunk_bytes = seen_count = 0
+    for chunk in profiler.iter_span('baca file (read_csv)', iter_file_chunks(source, delimiter, chunksize)):
+        chunks += 1
+        peak_chunk_bytes = max(peak_chunk_bytes, int(chunk.memory_usage(deep=True).sum()))
+        total_rows += len(chunk)
+        if rename:
+            # Header lama (mis. "Link") disamakan dulu agar hapus duplikat dan cek link lama tidak terlewat
+            chunk.rename(columns=rename, inplace=True)
+
+        if dedup_col in chunk.columns:
+            with profiler.span('hapus duplikat dalam file', rows_in=len(chunk)) as span:
+                links = chunk[dedup_col]
+                dupes = links.duplicated() | links.isin(seen_links)
+                if dupes.any():
+                    chunk = chunk[~dupes].copy()
+                seen_links.update(chunk[dedup_col])
+                span['rows_out'] = len(chunk)
+
+            if tracker is not None:
+                with profiler.span('cek link lama', rows_in=len(chunk)) as span:
+                    seen, changed, skip, keys, fingerprints = tracker.classify(chunk, dedup_col,
+                                                                               FINGERPRINT_IGNORE_COLS)
+                    seen_count += int(np.count_nonzero(seen))
+                    for field, values in zip(link_parts, (keys, fingerprints, seen, changed, skip)):
+                        link_parts[field].append(values)
+                    if tracker.skip_seen and skip.any():
+                        chunk = chunk[~skip].copy()
+                    span['rows_out'] = len(chunk)
+
+        with profiler.span('preprocessing', rows_in=len(chunk)) as span:
+            # Peringatan kolom hilang cukup sekali per file, dari chunk pertama
+            processed = preprocess(chunk) if chunks == 1 else preprocess(chunk, warn=ignore_warning)
+            span['rows_out'] = len(processed) if processed is not None else 0
+        if processed is None:
+            return None
+        parts.append(processed)
+
+    return {
+        'parts': parts,
+        'total_rows': total_rows,
+        'rows': sum(len(part) for part in parts),
+        'seen': seen_count,
+        'links': link_parts,
+        'chunks': chunks,
+        'peak_chunk_bytes': peak_chunk_bytes,
+        'seconds': time.perf_counter() - started,
+        'profile': profiler.records(),
+    }
+
+
+def unique_links(link_parts):
+    # Link yang sama di beberapa file dihitung dan dicatat sekali, dari file pertama
+    # (sama seperti hapus duplikat lintas file dengan keep='first')
+    links = {field: np.concatenate(parts) for field, parts in link_parts.items()}
+    _, first = np.unique(links['keys'], return_index=True)
+    first.sort()
+    return {field: values[first] for field, values in links.items()}
+
+
+def load_files(sources, delimiter_for, dedup_col, preprocess, category_cols=(),
+               tracker=None, executor=None, profiler=None, chunksize=CHUNK_ROWS, rename=None,
+               numeric_cols=None):
+    # File dibaca paralel di executor (CLI: process pool, jadi preprocess dan tracker harus bisa di-pickle),
+    # digabung sekali, lalu duplikat lintas file dihapus (keep='first') dan dtype diringkas.
+    # None jika preprocess menolak data; file yang gagal dibaca dicatat di errors
+    profiler = profiler or Profiler()
+    rss_before = peak_rss_bytes()
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(sources))))
+    try:
+        futures = [
+            executor.submit(load_file, source, delimiter_for(source_name(source)), dedup_col,
+                            preprocess, tracker, chunksize, rename)
+            for source in sources
+        ]
+
+        parts, row_counts, source_names, file_stats, errors = [], [], [], [], []
+        memory = {'file_bytes': 0, 'chunks': 0, 'peak_chunk_bytes': 0, 'raw_frame_bytes': 0, 'frame_bytes': 0,
+                  'peak_bytes': None, 'peak_source': None, 'peak_growth_bytes': None}
+        links = {'new': 0, 'seen': 0, 'changed': 0, 'skipped': 0}
+        link_parts = {'keys': [], 'fingerprints': [], 'seen': [], 'changed': [], 'skip': []}
+        total_rows = 0
+        for source, future in zip(sources, futures):
+            name = source_name(source)
+            try:
+                loaded = future.result()
+            except Exception as e:
+                errors.append(f"Gagal membaca {name}: {e}")
+                continue
+            if loaded is None:
+                return None
+
+            profiler.merge(loaded['profile'])
+            parts.extend(loaded['parts'])
+            row_counts.append(loaded['rows'])
+            source_names.append(name)
+            total_rows += loaded['total_rows']
+            for field, parts_of_field in loaded['links'].items():
+                link_parts[field].extend(parts_of_field)
+            memory['file_bytes'] += source_size(source)
+            memory['chunks'] += loaded['chunks']
+            memory['peak_chunk_bytes'] = max(memory['peak_chunk_bytes'], loaded['peak_chunk_bytes'])
+            file_stats.append({
+                'File': name,
+                'Baris dibaca': loaded['total_rows'],
+                'Baris unik dalam file': loaded['rows'],
+                'Sudah pernah diproses': loaded['seen'],
+                'Chunk': loaded['chunks'],
+                'Waktu (detik)': round(loaded['seconds'], 3),
+            })
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    if tracker is not None and link_parts['keys']:
+        with profiler.span('catat link baru') as span:
+            unique = unique_links(link_parts)
+            links['seen'] = int(np.count_nonzero(unique['seen']))
+            links['changed'] = int(np.count_nonzero(unique['changed']))
+            links['new'] = len(unique['keys']) - links['seen'] - links['changed']
+            if tracker.skip_seen:
+                links['skipped'] = int(np.count_nonzero(unique['skip']))
+            unseen = ~unique['seen']
+            tracker.record(unique['keys'][unseen], unique['fingerprints'][unseen])
+            span['rows_out'] = int(np.count_nonzero(unseen))
+
+    with profiler.span('gabung file (concat)', rows_in=sum(row_counts)) as span:
+        combined_df = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+        span['rows_out'] = len(combined_df)
+    if not combined_df.empty:
+        categories = list(dict.fromkeys(source_names))
+        codes = np.repeat([categories.index(name) for name in source_names], row_counts)
+        combined_df[SOURCE_COL] = pd.Categorical.from_codes(codes, categories=categories)
+        if dedup_col in combined_df.columns:
+            with profiler.span('hapus duplikat lintas file', rows_in=len(combined_df)) as span:
+                combined_df.drop_duplicates(subset=[dedup_col], keep='first', inplace=True)
+                combined_df.reset_index(drop=True, inplace=True)
+                span['rows_out'] = len(combined_df)
+        memory['raw_frame_bytes'] = int(combined_df.memory_usage(deep=True).sum())
+        with profiler.span('ringkas dtype', rows_in=len(combined_df)) as span:
+            compact_frame(combined_df, category_cols, numeric_cols)
+            span['rows_out'] = len(combined_df)
+        memory['frame_bytes'] = int(combined_df.memory_usage(deep=True).sum())
+
+    # Memori puncak nyata selama memuat: semua chunk hasil preprocessing ditahan sampai digabung,
+    # jadi puncaknya ikut besar file. Dengan tracemalloc dipakai puncak tahap-tahap di atas,
+    # tanpa tracemalloc dipakai RSS puncak proses (ikut menghitung sesi lain yang berjalan bersamaan)
+    stage_peaks = [record['peak_bytes'] for record in profiler.records() if record['peak_bytes'] is not None]
+    if tracemalloc.is_tracing() and stage_peaks:
+        memory['peak_bytes'], memory['peak_source'] = max(stage_peaks), 'tracemalloc'
+    elif rss_before is not None:
+        rss_after = peak_rss_bytes()
+        memory['peak_bytes'], memory['peak_source'] = rss_after, 'RSS proses'
+        memory['peak_growth_bytes'] = rss_after - rss_before
+
+    return {
+        'combined_df': combined_df,
+        'total_rows': total_rows,
+        'deleted_dupes': total_rows - links['skipped'] - len(combined_df),
+        'unique_rows': len(combined_df),
+        'memory': memory,
+        'links': links,
+        'file_stats': file_stats,
+        'errors': errors,
+        'profile': profiler.records(),
+        'profiled_at': time.time(),
+    }
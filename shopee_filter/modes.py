@@ -0,0 +1,252 @@
+import logging
+from functools import partial
+
+from .cleaning import clean_columns, clean_flag
+from .filter_engine import clause, range_clauses
+
+logger = logging.getLogger(__name__)
+
+# === KOLOM ANGKA PER MODE ===
+# {kolom: (jenis parsing, dtype)}; Harga tetap float64 karena float32 kehilangan
+# presisi rupiah di atas ~16,7 juta
+XYRA_NUMERIC_COLUMNS = {
+    'Harga': ('currency', 'float64'),
+    'Stock': ('number', 'int32'),
+    'Terjual(Bulanan)': ('number', 'int32'),
+    'Komisi(%)': ('percent', 'float32'),
+    'Komisi(Rp)': ('number', 'float32'),
+    'Jumlah Live': ('number', 'int32'),
+}
+SHOPTIK_NUMERIC_COLUMNS = {
+    'trendPercentage': ('percent', 'float32'),
+    'Harga': ('currency', 'float64'),
+    'Penjualan (30 Hari)': ('number', 'int32'),
+    'Stok': ('number', 'int32'),
+    'Peringkat': ('rating', 'float32'),
+}
+# Kolom teks yang selalu disimpan sebagai category (selain yang terdeteksi otomatis)
+SHOPEE_CATEGORY_COLUMNS = ('Lokasi Toko',)
+SHOPEE_NUMERIC_COLUMNS = {
+    'Harga': ('currency', 'float64'),
+    'Stock': ('number', 'int32'),
+    'Terjual Bulanan': ('number', 'int32'),
+    'Rating': ('number', 'float32'),
+}
+SHOPEE_RENAME_MAP = {
+    'Harga Produk': 'Harga',
+    'Stok Barang': 'Stock',
+    'Penjualan Bulanan': 'Terjual Bulanan',
+    'Rating Toko': 'Rating',
+    'Lokasi': 'Lokasi Toko',
+    'Link': 'Link Produk'
+}
+
+
+def log_warning(message):
+    # Pengganti st.warning di luar Streamlit (CLI, proses pekerja)
+    logger.warning(message)
+
+
+# === XYRA ===
+def preprocess_xyra(df, warn=log_warning):
+    return clean_columns(df, XYRA_NUMERIC_COLUMNS)
+
+
+def xyra_filter_spec(t):
+    return [
+        clause('Stock', '>=', t['stok_min']),
+        clause('Harga', '>=', t['harga_min']),
+        *range_clauses('Terjual(Bulanan)', t['terjual_min'], t['terjual_max']),
+        *range_clauses('Komisi(%)', t['komisi_persen_min'], t['komisi_persen_max']),
+        *range_clauses('Komisi(Rp)', t['komisi_rp_min'], t['komisi_rp_max']),
+        *range_clauses('Jumlah Live', t['jumlah_live_min'], t['jumlah_live_max']),
+    ]
+
+
+# === SHOPTIK ===
+def preprocess_shoptik(df, warn=log_warning):
+    required_cols = ['productLink', 'Peringkat', 'Penjualan (30 Hari)', 'Harga', 'Stok', 'trendPercentage']
+    for col in required_cols:
+        if col not in df.columns:
+            warn(f"Kolom '{col}' tidak ditemukan dalam file.")
+            df[col] = None
+    # Bersihkan data
+    clean_columns(df, SHOPTIK_NUMERIC_COLUMNS)
+    df['isAd'] = clean_flag(df['isAd'], 'True|1|Ya|Yes')
+    return df
+
+
+def shoptik_filter_spec(t):
+    return [
+        clause('trendPercentage', '>=', t['trend_percentage_min']),
+        clause('Harga', '>=', t['harga_min']),
+        clause('Penjualan (30 Hari)', '>=', t['penjualan_30_hari_min']),
+        clause('Stok', '>=', t['stok_min']),
+        clause('Peringkat', '>=', t['rating_min']),
+        clause('isAd', 'is_true', t['is_ad']),
+    ]
+
+
+# === SHOPEE TOKO LOKAL ===
+def check_required_columns(df, required_cols, warn=log_warning):
+    missing_cols = [col for col in required_cols if col not in df.columns]
+    if missing_cols:
+        warn(f"⚠️ Kolom berikut tidak ditemukan dalam file: {missing_cols}")
+        return False
+    return True
+
+
+def rename_columns_smart(df):
+    df.rename(columns=SHOPEE_RENAME_MAP, inplace=True)
+    return df
+
+
+def preprocess_shopee(df, require_location=False, warn=log_warning):
+    required_columns = ['Harga', 'Stock', 'Terjual Bulanan', 'Rating']
+    if require_location:
+        required_columns.append('Lokasi Toko')
+
+    df = rename_columns_smart(df)
+    if not check_required_columns(df, required_columns, warn):
+        return None
+
+    if 'No' in df.columns:
+        df = df.drop(columns=['No'])
+
+    clean_columns(df, SHOPEE_NUMERIC_COLUMNS, fill=None)
+
+    if 'Flash Sale' in df.columns:
+        df['Flash Sale'] = clean_flag(df['Flash Sale'], 'TRUE|True|1')
+
+    return df
+
+
+def number_rows(df):
+    # Nomor urut dibuat ulang setelah penggabungan dan hapus duplikat
+    df.insert(0, 'No', range(1, len(df) + 1))
+    return df
+
+
+def shopee_filter_spec(t):
+    return [
+        clause('Harga', '>=', t['harga_min']),
+        clause('Stock', '>=', t['stok_min']),
+        clause('Terjual Bulanan', '>=', t['terjual_bulanan_min']),
+        clause('Rating', '>=', t['rating_min']),
+        clause('Lokasi Toko', 'contains', t['lokasi_khusus'], optional=True),
+    ]
+
+
+# === DAFTAR MODE ===
+# delimiter None berarti ditentukan dari ekstensi file (.txt = tab, selain itu koma)
+# scores: {label: rumus pandas.eval} untuk peringkat top-N (lihat ranking.py)
+# group_cols: kolom yang bisa dipakai untuk membatasi jumlah produk per grup di peringkat
+# message_cols: kolom ringkasan produk saat dikirim sebagai pesan Telegram
+# numeric_cols: kolom angka yang dtype ringkasnya dipilih ulang setelah chunk digabung
+# rename: {header lama: header baru} yang disamakan per chunk sebelum hapus duplikat
+MODES = {
+    'xyra': {
+        'label': "Filter Produk Extension Xyra",
+        'delimiter': '\t',
+        'dedup_col': 'Link Produk',
+        'rename': None,
+        'category_cols': (),
+        'preprocess': preprocess_xyra,
+        'numeric_cols': XYRA_NUMERIC_COLUMNS,
+        'finalize': None,
+        'filter_spec': xyra_filter_spec,
+        'scores': {
+            "Komisi Rp × Terjual": "`Komisi(Rp)` * `Terjual(Bulanan)`",
+            "Komisi (Rp)": "`Komisi(Rp)`",
+            "Komisi (%)": "`Komisi(%)`",
+            "Terjual per bulan": "`Terjual(Bulanan)`",
+        },
+        'group_cols': (),
+        'message_cols': ('Harga', 'Komisi(%)', 'Komisi(Rp)', 'Terjual(Bulanan)'),
+        'defaults': {
+            'stok_min': 10,
+            'harga_min': 0.0,
+            'terjual_min': 5,
+            'terjual_max': 100,
+            'komisi_persen_min': 0.0,
+            'komisi_persen_max': 8.0,
+            'komisi_rp_min': 500.0,
+            'komisi_rp_max': 5000.0,
+            'jumlah_live_min': 0,
+            'jumlah_live_max': 0,
+        },
+    },
+    'shoptik': {
+        'label': "Filter Produk Shoptik",
+        'delimiter': ',',
+        'dedup_col': 'productLink',
+        'rename': None,
+        'category_cols': (),
+        'preprocess': preprocess_shoptik,
+        'numeric_cols': SHOPTIK_NUMERIC_COLUMNS,
+        'finalize': None,
+        'filter_spec': shoptik_filter_spec,
+        'scores': {
+            "Tren (%)": "trendPercentage",
+            "Penjualan 30 hari × Harga": "`Penjualan (30 Hari)` * Harga",
+            "Penjualan 30 hari": "`Penjualan (30 Hari)`",
+            "Rating": "Peringkat",
+        },
+        'group_cols': (),
+        'message_cols': ('Harga', 'trendPercentage', 'Penjualan (30 Hari)', 'Peringkat'),
+        'defaults': {
+            'trend_percentage_min': 50.0,
+            'harga_min': 0.0,
+            'penjualan_30_hari_min': 100,
+            'stok_min': 10,
+            'rating_min': 4.0,
+            'is_ad': False,
+        },
+    },
+    'shopee': {
+        'label': "Filter Produk Shopee Toko Lokal",
+        'delimiter': None,
+        'dedup_col': 'Link Produk',
+        'rename': SHOPEE_RENAME_MAP,
+        'category_cols': SHOPEE_CATEGORY_COLUMNS,
+        'preprocess': preprocess_shopee,
+        'numeric_cols': SHOPEE_NUMERIC_COLUMNS,
+        'finalize': number_rows,
+        'filter_spec': shopee_filter_spec,
+        'scores': {
+            "Terjual × Harga": "`Terjual Bulanan` * Harga",
+            "Terjual bulanan": "`Terjual Bulanan`",
+            "Rating": "Rating",
+        },
+        'group_cols': ('Lokasi Toko',),
+        'message_cols': ('Harga', 'Terjual Bulanan', 'Rating', 'Lokasi Toko'),
+        'defaults': {
+            'harga_min': 50000.0,
+            'stok_min': 10,
+            'terjual_bulanan_min': 100,
+            'rating_min': 4.0,
+            'lokasi_khusus': '',
+        },
+    },
+}
+
+
+def resolve_thresholds(mode, thresholds=None):
+    unknown = set(thresholds or {}) - set(MODES[mode]['defaults'])
+    if unknown:
+        raise ValueError(f"Batas filter tidak dikenal untuk mode {mode}: {sorted(unknown)}")
+    return {**MODES[mode]['defaults'], **(thresholds or {})}
+
+
+def delimiter_for(mode, name):
+    delimiter = MODES[mode]['delimiter']
+    if delimiter is None:
+        return '\t' if name.endswith('.txt') else ','
+    return delimiter
+
+
+def make_preprocess(mode, thresholds, warn=log_warning):
+    # Hasilnya partial dari fungsi tingkat modul, jadi tetap bisa di-pickle untuk process pool
+    if mode == 'shopee':
+        return partial(preprocess_shopee, require_location=bool(thresholds['lokasi_khusus']), warn=warn)
+    return partial(MODES[mode]['preprocess'], warn=warn)
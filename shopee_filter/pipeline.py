@@ -0,0 +1,59 @@
+from functools import partial
+
+import numpy as np
+
+from .filter_engine import evaluate_filters, partition_rows
+from .loader import load_files
+from .modes import MODES, delimiter_for, log_warning, make_preprocess, resolve_thresholds
+from .profiling import Profiler
+from .ranking import rank_mode
+
+# === PIPELINE TANPA UI ===
+
+
+def load_mode(mode, sources, thresholds=None, tracker=None, executor=None, warn=log_warning, profiler=None):
+    # Hanya batas yang memengaruhi preprocessing (lokasi wajib di Toko Lokal) yang dipakai di sini
+    spec = MODES[mode]
+    thresholds = resolve_thresholds(mode, thresholds)
+    result = load_files(sources, partial(delimiter_for, mode), spec['dedup_col'],
+                        make_preprocess(mode, thresholds, warn), spec['category_cols'],
+                        tracker, executor, profiler, rename=spec['rename'],
+                        numeric_cols=spec['numeric_cols'])
+    if result is not None and spec['finalize'] and not result['combined_df'].empty:
+        spec['finalize'](result['combined_df'])
+    return result
+
+
+def filter_mode(mode, df, thresholds=None):
+    return evaluate_filters(df, MODES[mode]['filter_spec'](resolve_thresholds(mode, thresholds)))
+
+
+def run_pipeline(mode, sources, thresholds=None, tracker=None, executor=None,
+                 shuffle=False, seed=None, warn=log_warning, profiler=None, ranking=None):
+    # passed_rows/removed_rows berupa posisi baris atas combined_df; dengan ranking, passed_rows
+    # hanya produk top-N urut skor menurun. None jika data ditolak saat preprocessing
+    profiler = profiler or Profiler()
+    result = load_mode(mode, sources, thresholds, tracker, executor, warn, profiler)
+    if result is None:
+        return None
+    df = result['combined_df']
+    with profiler.span('filter', rows_in=len(df)) as span:
+        if df.empty:
+            passed, filter_stats = np.zeros(0, dtype=bool), []
+        else:
+            passed, filter_stats = filter_mode(mode, df, thresholds)
+        span['rows_out'] = int(np.count_nonzero(passed))
+    with profiler.span('pisahkan lolos/sampah', rows_in=len(df)):
+        passed_rows, removed_rows = partition_rows(passed, shuffle=shuffle, seed=seed)
+    if ranking:
+        with profiler.span('peringkat top-N', rows_in=len(passed_rows)) as span:
+            passed_rows = rank_mode(mode, df, passed_rows, ranking)
+            span['rows_out'] = len(passed_rows)
+    return {
+        **result,
+        'passed': passed,
+        'filter_stats': filter_stats,
+        'passed_rows': passed_rows,
+        'removed_rows': removed_rows,
+        'profile': profiler.records(),
+    }
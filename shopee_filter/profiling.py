@@ -0,0 +1,110 @@
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# === PROFIL WAKTU & MEMORI PER TAHAP ===
+# File JSON lines untuk mengumpulkan profil lintas sesi; kosong berarti tidak ditulis
+LOG_PATH = os.environ.get('PROFILE_LOG_PATH', '')
+# tracemalloc memperlambat semua alokasi, jadi hanya aktif jika diminta
+TRACE_MEMORY = os.environ.get('PROFILE_TRACE_MEMORY', '') not in ('', '0')
+
+_active_spans = 0
+_active_lock = threading.Lock()
+_log_lock = threading.Lock()
+
+
+def add_optional(total, value):
+    if value is None:
+        return total
+    return value if total is None else total + value
+
+
+class Profiler:
+    # Span dengan nama tahap sama dijumlahkan (mis. satu span per chunk). Memori puncak hanya jika
+    # tracemalloc aktif, dan berlaku untuk seluruh proses termasuk span di thread lain
+    def __init__(self):
+        self.stages = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, stage, rows_in=None):
+        global _active_spans
+        span = {'rows_out': None, 'calls': 1}
+        tracing = tracemalloc.is_tracing()
+        with _active_lock:
+            # Puncak hanya di-reset jika tidak ada span lain yang sedang mengukur
+            if tracing and _active_spans == 0:
+                tracemalloc.reset_peak()
+            _active_spans += 1
+        started = time.perf_counter()
+        try:
+            yield span
+        finally:
+            seconds = time.perf_counter() - started
+            peak_bytes = tracemalloc.get_traced_memory()[1] if tracing and tracemalloc.is_tracing() else None
+            with _active_lock:
+                _active_spans -= 1
+            self.add(stage, seconds, rows_in, span['rows_out'], peak_bytes, span['calls'])
+
+    def iter_span(self, stage, iterable):
+        # Ukur waktu mengambil tiap item (mis. read_csv per chunk); baris keluar = len(item).
+        # next() terakhir yang tidak menghasilkan item ikut dihitung waktunya, bukan panggilannya
+        iterator = iter(iterable)
+        while True:
+            with self.span(stage) as span:
+                item = next(iterator, None)
+                if item is None:
+                    span['calls'] = 0
+                else:
+                    span['rows_out'] = len(item)
+            if item is None:
+                return
+            yield item
+
+    def add(self, stage, seconds, rows_in=None, rows_out=None, peak_bytes=None, calls=1):
+        with self._lock:
+            record = self.stages.setdefault(stage, {
+                'stage': stage, 'calls': 0, 'seconds': 0.0,
+                'rows_in': None, 'rows_out': None, 'peak_bytes': None,
+            })
+            record['calls'] += calls
+            record['seconds'] += seconds
+            record['rows_in'] = add_optional(record['rows_in'], rows_in)
+            record['rows_out'] = add_optional(record['rows_out'], rows_out)
+            if peak_bytes is not None:
+                record['peak_bytes'] = max(record['peak_bytes'] or 0, peak_bytes)
+
+    def merge(self, records):
+        for record in records:
+            self.add(record['stage'], record['seconds'], record['rows_in'], record['rows_out'],
+                     record['peak_bytes'], record['calls'])
+
+    def records(self):
+        with self._lock:
+            return [dict(record) for record in self.stages.values()]
+
+
+def peak_rss_bytes():
+    # RSS puncak proses sejak mulai (high-water mark); None jika modul resource tidak ada (Windows)
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024  # Linux melaporkan KiB
+
+
+def write_log(records, path=LOG_PATH, **context):
+    # Satu baris JSON (konteks + daftar tahap) per run; tidak ditulis jika path kosong
+    if not path:
+        return
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    line = json.dumps({'time': time.time(), **context, 'stages': records}, ensure_ascii=False)
+    with _log_lock, open(path, 'a', encoding='utf-8') as f:
+        f.write(line + '\n')
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+from .link_store import SHOPEE_ITEM_PATTERN
+from .modes import MODES
+
+# === PERINGKAT TOP-N ===
+# Nilai khusus untuk `group`: batasi per toko berdasarkan shopid di link produk
+SHOP_GROUP = 'Toko (dari link)'
+
+
+def ranking(score, top_n, group=None, per_group=None):
+    # score: label rumus bawaan mode (lihat MODES[mode]['scores']) atau rumus pandas.eval sendiri
+    return {'score': score, 'top_n': top_n, 'group': group, 'per_group': per_group}
+
+
+def score_expression(mode, score):
+    return MODES[mode]['scores'].get(score, score)
+
+
+def score_values(df, positions, expr):
+    # Skor float64 hanya untuk baris positions; NaN dianggap skor terendah
+    # Hanya kolom angka yang disebut di rumus yang diambil, dan hanya untuk baris lolos
+    columns = [col for col in df.columns
+               if col in expr and pd.api.types.is_numeric_dtype(df[col].dtype)]
+    subset = pd.DataFrame({col: df[col].to_numpy()[positions] for col in columns})
+    try:
+        result = subset.eval(expr)
+    except Exception as e:
+        raise ValueError(f"Rumus skor tidak valid: {expr} ({e})") from e
+    scores = np.array(np.broadcast_to(np.asarray(result, dtype='float64'), len(positions)))
+    scores[np.isnan(scores)] = -np.inf
+    return scores
+
+
+def group_values(df, positions, group, link_col):
+    if group == SHOP_GROUP:
+        return df[link_col].take(positions).astype(str).str.extract(SHOPEE_ITEM_PATTERN)[0].to_numpy()
+    return df[group].take(positions).to_numpy()
+
+
+def cap_per_group(groups, scores, per_group):
+    # Urutkan (grup, skor menurun) sekali, lalu ambil `per_group` teratas di setiap grup
+    codes = pd.factorize(groups, use_na_sentinel=False)[0]
+    order = np.lexsort((-scores, codes))
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    lengths = np.diff(np.r_[starts, len(order)])
+    rank_in_group = np.arange(len(order)) - np.repeat(starts, lengths)
+    keep = np.zeros(len(order), dtype=bool)
+    keep[order[rank_in_group < per_group]] = True
+    return keep
+
+
+def top_n_rows(scores, top_n):
+    # Seleksi parsial O(n) dengan argpartition; hanya N teratas yang diurutkan
+    if top_n < len(scores):
+        top = np.argpartition(-scores, top_n - 1)[:top_n]
+    else:
+        top = np.arange(len(scores))
+    return top[np.argsort(-scores[top], kind='stable')]
+
+
+def rank_rows(df, positions, expr, top_n, group=None, per_group=None, link_col=None):
+    # Top-N urut skor menurun; dengan group/per_group setiap grup dibatasi lebih dulu,
+    # sisanya cukup seleksi parsial
+    if not len(positions) or not top_n:
+        return positions[:0]
+    scores = score_values(df, positions, expr)
+    if group and per_group:
+        keep = cap_per_group(group_values(df, positions, group, link_col), scores, per_group)
+        positions, scores = positions[keep], scores[keep]
+    return positions[top_n_rows(scores, top_n)]
+
+
+def rank_mode(mode, df, positions, options):
+    return rank_rows(df, positions, score_expression(mode, options['score']), options['top_n'],
+                     options.get('group'), options.get('per_group'), MODES[mode]['dedup_col'])
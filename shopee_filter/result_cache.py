@@ -0,0 +1,174 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# === CACHE HASIL BERSAMA ANTAR SESI ===
+DEFAULT_DIR = os.environ.get(
+    'RESULT_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'filter-produk', 'results')
+)
+MEMORY_BUDGET = int(os.environ.get('RESULT_CACHE_MEMORY_MB', 1024)) * 2**20
+DISK_BUDGET = int(os.environ.get('RESULT_CACHE_DISK_MB', 8192)) * 2**20
+
+
+def entry_name(key):
+    return hashlib.blake2b(repr(key).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def frame_bytes(result):
+    return int(result['combined_df'].memory_usage(deep=True).sum())
+
+
+def string_dtype_mapper(pa):
+    # Tanpa ini pandas 2 membaca kolom teks sebagai string[python] (disalin ke heap Python);
+    # string[pyarrow] tetap memakai buffer Arrow dari file yang di-memory-map. Jika pandas
+    # sudah membaca teks sebagai str berbasis Arrow (future.infer_string), tidak perlu dipetakan
+    try:
+        if pd.get_option('future.infer_string'):
+            return None
+    except KeyError:
+        pass
+    dtype = pd.StringDtype('pyarrow')
+    return {pa.string(): dtype, pa.large_string(): dtype}.get
+
+
+class ResultCache:
+    # Lewat budget memori, entri paling lama tidak dipakai ditulis ke Feather dan dibaca lagi dengan
+    # memory-map; file di disk dibatasi disk_budget. Frame dipakai bersama, jangan diubah in-place
+    def __init__(self, directory=DEFAULT_DIR, memory_budget=MEMORY_BUDGET, disk_budget=DISK_BUDGET):
+        self.directory = directory
+        self.memory_budget = memory_budget
+        self.disk_budget = disk_budget
+        self.stats = {'memory': 0, 'disk': 0, 'miss': 0}
+        self._entries = OrderedDict()  # {kunci: (hasil, ukuran byte)}
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._loading = {}
+
+    def _paths(self, key):
+        name = entry_name(key)
+        return (os.path.join(self.directory, f"{name}.feather"),
+                os.path.join(self.directory, f"{name}.json"))
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats['memory'] += 1
+                return entry[0]
+        result = self._read_spilled(key)
+        if result is not None:
+            with self._lock:
+                self.stats['disk'] += 1
+            self.put(key, result)
+        return result
+
+    def get_or_load(self, key, load):
+        # Sesi lain dengan kunci sama menunggu load() yang sedang berjalan; hasil None tidak disimpan
+        with self._lock:
+            key_lock = self._loading.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                result = self.get(key)
+                if result is None:
+                    with self._lock:
+                        self.stats['miss'] += 1
+                    result = load()
+                    if result is not None:
+                        self.put(key, result)
+                return result
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+
+    def put(self, key, result):
+        size = frame_bytes(result)
+        evicted = []
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return
+            self._entries[key] = (result, size)
+            self._memory_bytes += size
+            while self._memory_bytes > self.memory_budget and len(self._entries) > 1:
+                old_key, (old_result, old_size) = self._entries.popitem(last=False)
+                self._memory_bytes -= old_size
+                evicted.append((old_key, old_result))
+        for old_key, old_result in evicted:
+            self._spill(old_key, old_result)
+        if evicted:
+            self._trim_disk()
+
+    def usage(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'memory_bytes': self._memory_bytes, **self.stats}
+
+    def _spill(self, key, result):
+        # pyarrow baru diimpor saat ada entri yang ditulis/dibaca dari disk
+        import pyarrow.feather as feather
+
+        frame_path, meta_path = self._paths(key)
+        if os.path.exists(frame_path) and os.path.exists(meta_path):
+            return
+        df = result['combined_df']
+        if df.empty:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Tulis ke file sementara dulu supaya proses lain tidak membaca file setengah jadi
+            feather.write_feather(df, f"{frame_path}.tmp", compression='uncompressed')
+            with open(f"{meta_path}.tmp", 'w', encoding='utf-8') as f:
+                json.dump({k: v for k, v in result.items() if k != 'combined_df'}, f)
+            os.replace(f"{frame_path}.tmp", frame_path)
+            os.replace(f"{meta_path}.tmp", meta_path)
+        except Exception as e:
+            logger.warning("Gagal menyimpan cache ke disk: %s", e)
+
+    def _read_spilled(self, key):
+        import pyarrow as pa
+        import pyarrow.feather as feather
+
+        frame_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            df = feather.read_table(frame_path, memory_map=True).to_pandas(types_mapper=string_dtype_mapper(pa))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Cache di disk rusak, dibaca ulang dari file: %s", e)
+            return None
+        os.utime(frame_path)  # tandai baru dipakai untuk urutan hapus di disk
+        return {**meta, 'combined_df': df}
+
+    def _trim_disk(self):
+        try:
+            names = [name for name in os.listdir(self.directory) if name.endswith('.feather')]
+        except FileNotFoundError:
+            return
+        files = []
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.disk_budget:
+                break
+            for stale in (path, path[:-len('.feather')] + '.json'):
+                try:
+                    os.remove(stale)
+                except FileNotFoundError:
+                    pass
+            total -= size
@@ -0,0 +1,192 @@
+import io
+import queue
+import threading
+import time
+from functools import partial
+
+from .exporter import write_export
+
+# === KIRIM HASIL KE TELEGRAM DI LATAR BELAKANG ===
+DEFAULT_BASE_URL = 'https://api.telegram.org/bot'
+MESSAGE_MAX_CHARS = 4096  # batas panjang satu pesan Telegram
+MESSAGES_PER_MINUTE = 20  # batas kirim ke grup/channel yang sama
+QUEUE_MAX_ITEMS = 100
+SEND_WORKERS = 2
+MAX_RETRIES = 5
+BACKOFF_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+FILE_MAX_ROWS = 50_000  # satu file CSV per 50 ribu produk agar jauh di bawah batas upload bot 50 MB
+MESSAGE_CHUNK_ROWS = 1_000
+ERROR_SAMPLES = 5
+
+
+def product_messages(df, positions, columns, link_col, max_chars=MESSAGE_MAX_CHARS):
+    # Satu produk = ringkasan kolom lalu link; baris dibentuk per potongan posisi, bukan sekaligus
+    columns = [col for col in columns if col in df.columns and col != link_col]
+    message = ''
+    for start in range(0, len(positions), MESSAGE_CHUNK_ROWS):
+        chunk = df.take(positions[start:start + MESSAGE_CHUNK_ROWS])
+        links = chunk[link_col].astype(str).tolist() if link_col in chunk.columns else [''] * len(chunk)
+        values = [chunk[col].tolist() for col in columns]
+        for i, link in enumerate(links):
+            summary = ' | '.join(f"{col}: {vals[i]}" for col, vals in zip(columns, values))
+            entry = '\n'.join(part for part in (summary, link) if part)[:max_chars]
+            if message and len(message) + 2 + len(entry) > max_chars:
+                yield ('message', message)
+                message = ''
+            message = f"{message}\n\n{entry}" if message else entry
+    if message:
+        yield ('message', message)
+
+
+def csv_bytes(df, positions, columns):
+    raw = io.BytesIO()
+    write_export(df, positions, columns, 'csv', raw)
+    return raw.getvalue()
+
+
+def product_files(df, positions, columns, file_stem, rows_per_file=FILE_MAX_ROWS):
+    # Isi file baru dibuat oleh pekerja saat akan dikirim, jadi antrean tidak menahan banyak file di RAM
+    parts = max(1, -(-len(positions) // rows_per_file))
+    for part, start in enumerate(range(0, max(len(positions), 1), rows_per_file), start=1):
+        suffix = f"_{part}" if parts > 1 else ''
+        yield ('document', f"{file_stem}{suffix}.csv",
+               partial(csv_bytes, df, positions[start:start + rows_per_file], columns),
+               f"{file_stem} ({part}/{parts})")
+
+
+class RateLimiter:
+    # Jeda minimum antar kiriman, dipakai bersama semua pekerja; RetryAfter menunda semuanya
+    def __init__(self, interval):
+        self.interval = interval
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            at = max(now, self._next)
+            self._next = at + self.interval
+        if at > now:
+            time.sleep(at - now)
+
+    def penalize(self, seconds):
+        with self._lock:
+            self._next = max(self._next, time.monotonic() + seconds)
+
+
+class DeliveryJob:
+    # Progres satu permintaan kirim; aman dibaca dari thread script Streamlit
+    def __init__(self):
+        self.queued = self.sent = self.failed = 0
+        self.feeding = True
+        self.cancelled = False
+        self.errors = []
+        self._lock = threading.Lock()
+
+    def _update(self, field, error=None):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+            if error and len(self.errors) < ERROR_SAMPLES:
+                self.errors.append(error)
+
+    def cancel(self):
+        self.cancelled = True
+
+    def progress(self):
+        with self._lock:
+            finished = self.sent + self.failed
+            done = not self.feeding and finished >= self.queued
+            return {
+                'queued': self.queued, 'sent': self.sent, 'failed': self.failed,
+                'done': done, 'cancelled': self.cancelled, 'errors': list(self.errors),
+                'fraction': finished / self.queued if self.queued else (1.0 if done else 0.0),
+            }
+
+
+class TelegramSender:
+    # submit langsung kembali; thread pengumpan mengisi antrean dan pekerja mengirim sesuai
+    # messages_per_minute. RetryAfter menunda semua pekerja, galat jaringan diulang dengan backoff
+    def __init__(self, token, chat_id, base_url=DEFAULT_BASE_URL, messages_per_minute=MESSAGES_PER_MINUTE,
+                 workers=SEND_WORKERS, queue_size=QUEUE_MAX_ITEMS):
+        import telegram
+        from telegram.utils.request import Request
+
+        self.chat_id = chat_id
+        self._token = token
+        self._bot = telegram.Bot(token=token, base_url=base_url,
+                                 request=Request(con_pool_size=workers + 2))
+        self._errors = telegram.error
+        self._limiter = RateLimiter(60.0 / messages_per_minute)
+        self._queue = queue.Queue(maxsize=queue_size)
+        for i in range(workers):
+            threading.Thread(target=self._work, name=f'telegram-{i}', daemon=True).start()
+
+    def submit(self, items):
+        job = DeliveryJob()
+        threading.Thread(target=self._feed, args=(job, items), name='telegram-feed', daemon=True).start()
+        return job
+
+    def _feed(self, job, items):
+        try:
+            for item in items:
+                if job.cancelled:
+                    break
+                job._update('queued')
+                self._queue.put((job, item))
+        except Exception as e:
+            job._update('failed', self._redact(e))
+        finally:
+            job.feeding = False
+
+    def _work(self):
+        while True:
+            job, item = self._queue.get()
+            try:
+                if job.cancelled:
+                    job._update('failed', "Dibatalkan")
+                else:
+                    self._send_with_retry(job, item)
+            except Exception as e:
+                # Galat tak terduga (mis. gagal membuat file) tidak boleh mematikan pekerja
+                job._update('failed', self._redact(e))
+            finally:
+                self._queue.task_done()
+
+    def _send(self, item):
+        if item[0] == 'message':
+            self._bot.send_message(chat_id=self.chat_id, text=item[1], disable_web_page_preview=True)
+        else:
+            _, filename, data, caption = item
+            self._bot.send_document(chat_id=self.chat_id, document=io.BytesIO(data),
+                                    filename=filename, caption=caption)
+
+    def _send_with_retry(self, job, item):
+        errors = self._errors
+        error = None
+        if item[0] == 'document' and callable(item[2]):
+            item = (item[0], item[1], item[2](), item[3])
+        for attempt in range(MAX_RETRIES + 1):
+            self._limiter.wait()
+            try:
+                self._send(item)
+                job._update('sent')
+                return
+            except errors.RetryAfter as e:
+                self._limiter.penalize(e.retry_after)
+                error = e
+            except (errors.BadRequest, errors.Unauthorized, errors.ChatMigrated) as e:
+                # BadRequest turunan NetworkError, tapi mengulang tidak akan berhasil
+                error = e
+                break
+            except (errors.TimedOut, errors.NetworkError) as e:
+                time.sleep(min(BACKOFF_MAX_SECONDS, BACKOFF_SECONDS * 2**attempt))
+                error = e
+            except errors.TelegramError as e:
+                error = e
+                break
+        job._update('failed', self._redact(error))
+
+    def _redact(self, error):
+        # Pesan galat jaringan memuat URL bot, yang berisi token
+        return str(error).replace(self._token, '***')
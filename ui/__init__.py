@@ -0,0 +1 @@
+"""Halaman Streamlit per mode; app.py hanya mengimpor modul mode yang dipilih."""
@@ -0,0 +1,330 @@
+import hashlib
+import re
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from shopee_filter.exporter import EXPORT_FORMATS, find_export, read_export, submit_export, wait_export
+from shopee_filter.link_store import LinkTracker
+from shopee_filter.loader import MAX_WORKERS, export_columns
+from shopee_filter.modes import MODES
+from shopee_filter.pipeline import load_mode
+from shopee_filter.profiling import TRACE_MEMORY, Profiler, write_log
+from shopee_filter.ranking import SHOP_GROUP, rank_mode, ranking
+from shopee_filter.result_cache import ResultCache
+from shopee_filter.telegram_delivery import (DEFAULT_BASE_URL, MESSAGES_PER_MINUTE, TelegramSender,
+                                             product_files, product_messages)
+
+# === FUNGSI UMUM ===
+EXPORT_WAIT_SECONDS = 2
+PAGE_SIZES = [50, 100, 250, 500]
+
+
+def sanitize_filename(name):
+    return re.sub(r'[\\/*?:"<>|]', '', name)
+
+
+# === PROFIL PER RUN ===
+def start_run():
+    # Modul ini hanya diimpor sekali per proses, jadi profiler per rerun disimpan di session
+    if TRACE_MEMORY and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    profiler = Profiler()
+    st.session_state['run_profile'] = {'started': time.time(), 'profiler': profiler}
+    return profiler
+
+
+def run_profiler():
+    return st.session_state['run_profile']['profiler']
+
+
+def format_bytes(num_bytes):
+    for unit in ['B', 'KB', 'MB']:
+        if num_bytes < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GB"
+
+
+def file_digest(uploaded_file):
+    # Hash isi file sekali per upload, disimpan di session agar rerun tidak menghitung ulang
+    digests = st.session_state.setdefault('file_digests', {})
+    key = (uploaded_file.name, uploaded_file.size, getattr(uploaded_file, 'file_id', None))
+    if key not in digests or key[2] is None:
+        digests[key] = hashlib.sha256(uploaded_file.getbuffer()).hexdigest()
+    return digests[key]
+
+
+def make_cache_key(mode, uploaded_files, *params):
+    return (mode, tuple(file_digest(file) for file in uploaded_files), params)
+
+
+@st.cache_resource
+def shared_result_cache():
+    # Satu cache untuk seluruh proses server, dipakai bersama oleh semua sesi
+    return ResultCache()
+
+
+def load_uploaded_files(cache_key, uploaded_files, thresholds=None, skip_seen=True):
+    mode, digests, _ = cache_key
+    # Urutan upload tidak mengubah batch: file yang sama dalam urutan lain tetap batch yang sama
+    tracker = LinkTracker(mode, batch=''.join(sorted(digests)), skip_seen=skip_seen)
+    # Widget Streamlit (st.warning di preprocessing) butuh konteks script di thread pekerja
+    ctx = get_script_run_ctx()
+    max_workers = max(1, min(MAX_WORKERS, len(uploaded_files)))
+    with ThreadPoolExecutor(max_workers=max_workers, initializer=add_script_run_ctx,
+                            initargs=(None, ctx)) as pool:
+        return load_mode(mode, uploaded_files, thresholds, tracker, pool, warn=st.warning)
+
+
+def load_uploaded_files_cached(cache_key, uploaded_files, thresholds=None, skip_seen=True):
+    # Kunci hanya cache_key dan skip_seen, jadi batas yang memengaruhi preprocessing harus ada di cache_key.
+    # Frame hasilnya dipakai bersama antar sesi dan tidak boleh diubah in-place
+    return shared_result_cache().get_or_load(
+        (cache_key, skip_seen),
+        lambda: load_uploaded_files(cache_key, uploaded_files, thresholds, skip_seen)
+    )
+
+
+def show_load_errors(result):
+    for error in result['errors']:
+        st.error(error)
+
+
+def process_requested(clicked, state_key, uploaded_files):
+    # Setelah tombol diklik, setiap perubahan filter langsung memfilter ulang data ter-cache
+    files_key = [(file.name, file.size) for file in uploaded_files]
+    if clicked:
+        st.session_state[state_key] = files_key
+    return st.session_state.get(state_key) == files_key
+
+
+def shuffle_seed():
+    # Seed acak per sesi: urutan "Acak produk" tetap sama antar rerun, jadi hasil ekspor bisa dipakai ulang
+    return st.session_state.setdefault('shuffle_seed', int(np.random.default_rng().integers(2**32)))
+
+
+def positions_key(positions):
+    return hashlib.blake2b(positions.tobytes(), digest_size=16).hexdigest()
+
+
+def download_section(label, df, positions, file_stem, export_format, data_key):
+    # File dibuat di latar belakang per kondisi filter dan baru dibaca ke memori saat tombol unduh diklik
+    ext, mime = EXPORT_FORMATS[export_format]
+    key = (data_key, positions_key(positions))
+    job = find_export(key, export_format)
+    if job is None:
+        if not st.button(f"📦 Siapkan {label} ({export_format})", key=f"prepare_{file_stem}_{label}"):
+            return
+        job = submit_export(key, df, positions, export_columns(df), export_format, run_profiler())
+
+    try:
+        wait_export(job, timeout=EXPORT_WAIT_SECONDS)
+    except FutureTimeoutError:
+        st.info(f"⏳ {label} sedang disiapkan di latar belakang.")
+        st.button("🔄 Periksa lagi", key=f"refresh_{file_stem}_{label}")
+        return
+    except Exception as e:
+        st.error(f"Gagal menyiapkan {label}: {e}")
+        return
+    st.download_button(
+        f"⬇️ Download {label}",
+        partial(read_export, job),
+        file_name=f"{sanitize_filename(file_stem)}.{ext}",
+        mime=mime
+    )
+
+
+@st.cache_resource
+def telegram_sender():
+    # Satu pengirim untuk seluruh server; hasilnya (pengirim, pesan galat), pengirim None jika
+    # [telegram] belum diatur atau pengirim gagal dibuat
+    try:
+        config = st.secrets['telegram']
+    except Exception:
+        return None, None
+    if not config.get('bot_token') or not config.get('chat_id'):
+        return None, None
+    try:
+        sender = TelegramSender(config['bot_token'], config['chat_id'],
+                                base_url=config.get('base_url', DEFAULT_BASE_URL),
+                                messages_per_minute=config.get('messages_per_minute', MESSAGES_PER_MINUTE))
+    except Exception as e:
+        # Pesan galat bisa memuat token bot, jadi disamarkan sebelum ditampilkan
+        return None, str(e).replace(config['bot_token'], '***')
+    return sender, None
+
+
+def telegram_section(label, mode, df, positions, file_stem, data_key):
+    # Pengiriman berjalan di antrean pengirim; progres disimpan di session dan dicek ulang saat rerun
+    sender, error = telegram_sender()
+    if error:
+        st.warning(f"📨 Kirim ke Telegram tidak aktif: pengirim gagal dibuat ({error}).")
+        return
+    if sender is None:
+        st.caption("📨 Kirim ke Telegram belum aktif: isi [telegram] bot_token dan chat_id di secrets.")
+        return
+    jobs = st.session_state.setdefault('telegram_jobs', {})
+    key = (data_key, positions_key(positions))
+    job = jobs.get(key)
+    if job is None:
+        col_kind, col_send = st.columns(2)
+        as_file = col_kind.radio("Kirim sebagai", ["Pesan", "File CSV"], horizontal=True,
+                                 key=f"telegram_kind_{file_stem}_{label}") == "File CSV"
+        if not col_send.button(f"📨 Kirim {label} ke Telegram", key=f"telegram_send_{file_stem}_{label}"):
+            return
+        if as_file:
+            items = product_files(df, positions, export_columns(df), sanitize_filename(file_stem))
+        else:
+            items = product_messages(df, positions, MODES[mode]['message_cols'], MODES[mode]['dedup_col'])
+        job = jobs[key] = sender.submit(items)
+
+    progress = job.progress()
+    status = f"📨 Telegram: {progress['sent']} terkirim, {progress['failed']} gagal dari {progress['queued']} kiriman"
+    st.progress(min(progress['fraction'], 1.0), text=status)
+    for error in progress['errors']:
+        st.warning(error)
+    if progress['done']:
+        if st.button("📨 Kirim ulang", key=f"telegram_again_{file_stem}_{label}"):
+            del jobs[key]
+            st.rerun()
+        return
+    col_refresh, col_cancel = st.columns(2)
+    col_refresh.button("🔄 Perbarui status", key=f"telegram_refresh_{file_stem}_{label}")
+    if col_cancel.button("⛔ Batalkan", key=f"telegram_cancel_{file_stem}_{label}"):
+        job.cancel()
+
+
+def show_paged_table(df, positions, key):
+    # Hanya halaman aktif yang dikirim ke browser; sort dihitung dari posisi tanpa menyalin seluruh data
+    total = len(positions)
+    col_size, col_sort, col_order, col_page = st.columns(4)
+    page_size = col_size.selectbox("Baris per halaman", PAGE_SIZES, key=f"{key}_page_size")
+    sort_col = col_sort.selectbox("Urutkan berdasarkan", ['(urutan asli)', *df.columns], key=f"{key}_sort")
+    ascending = col_order.radio("Urutan", ['Naik', 'Turun'], horizontal=True, key=f"{key}_order") == 'Naik'
+    page_count = max(1, -(-total // page_size))
+    # Jumlah halaman bisa menyusut saat filter diubah; nomor halaman lama disesuaikan dulu
+    if st.session_state.get(f"{key}_page", 1) > page_count:
+        st.session_state[f"{key}_page"] = page_count
+    page = col_page.number_input(f"Halaman (1-{page_count})", min_value=1, max_value=page_count,
+                                 key=f"{key}_page")
+    with st.expander("Kolom ditampilkan"):
+        columns = st.multiselect("Kolom", list(df.columns), default=list(df.columns), key=f"{key}_columns")
+
+    if sort_col != '(urutan asli)' and total:
+        values = df[sort_col].take(positions).reset_index(drop=True)
+        order = values.sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+        positions = positions[order]
+
+    start = (page - 1) * page_size
+    page_rows = positions[start:start + page_size]
+    view = df.take(page_rows)[columns or list(df.columns)]
+    view.index = pd.RangeIndex(start + 1, start + 1 + len(view))
+    with run_profiler().span('tampilkan tabel (st.dataframe)', rows_in=len(view)):
+        st.dataframe(view)
+    st.caption(f"Menampilkan baris {start + 1 if len(view) else 0}-{start + len(view)} dari {total}")
+
+
+def show_file_stats(file_stats):
+    with st.expander("📄 Rincian per file"):
+        st.dataframe(pd.DataFrame(file_stats))
+
+
+def link_stats_html(links):
+    return f"""
+                            <li>Produk baru (belum pernah diproses): <strong>{links['new']}</strong></li>
+                            <li>Produk berubah sejak terakhir diproses: <strong>{links['changed']}</strong></li>
+                            <li>Produk sudah pernah diproses: <strong>{links['seen']}</strong> (dilewati: {links['skipped']})</li>"""
+
+
+def peak_memory_html(memory):
+    # Hasil lama di cache disk belum punya kunci memori puncak
+    if memory.get('peak_bytes') is None:
+        return "<strong>-</strong>"
+    detail = memory['peak_source']
+    if memory.get('peak_growth_bytes') is not None:
+        detail += f", naik {format_bytes(memory['peak_growth_bytes'])} saat memuat"
+    return f"<strong>{format_bytes(memory['peak_bytes'])}</strong> ({detail})"
+
+
+def memory_stats_html(memory):
+    return f"""
+                            <li>Ukuran file diunggah: <strong>{format_bytes(memory['file_bytes'])}</strong></li>
+                            <li>Chunk dibaca: <strong>{memory['chunks']}</strong> (terbesar: {format_bytes(memory['peak_chunk_bytes'])})</li>
+                            <li>Memori puncak saat memuat: {peak_memory_html(memory)}</li>
+                            <li>Memori data sebelum diringkas: <strong>{format_bytes(memory['raw_frame_bytes'])}</strong></li>
+                            <li>Memori data (dtype ringkas): <strong>{format_bytes(memory['frame_bytes'])}</strong></li>"""
+
+
+def show_filter_stats(filter_stats):
+    with st.expander("🔍 Alasan produk tidak lolos"):
+        st.dataframe(pd.DataFrame(filter_stats))
+
+
+def ranking_sidebar(mode):
+    # Pengaturan peringkat top-N setelah filter; None jika tidak diaktifkan
+    st.sidebar.subheader("🏆 Peringkat Top-N")
+    if not st.sidebar.checkbox("Ambil produk terbaik saja", value=False, key=f"{mode}_rank",
+                               help="Produk lolos filter diberi skor, lalu hanya N teratas yang ditampilkan dan diunduh"):
+        return None
+    scores = MODES[mode]['scores']
+    score = st.sidebar.selectbox("Skor", [*scores, "Rumus sendiri"], key=f"{mode}_score")
+    if score == "Rumus sendiri":
+        score = st.sidebar.text_input("Rumus skor", value=next(iter(scores.values())), key=f"{mode}_score_expr",
+                                      help="Gabungan kolom angka, mis. `Komisi(Rp)` * `Terjual(Bulanan)`. "
+                                           "Nama kolom dengan spasi atau tanda kurung ditulis di dalam backtick.")
+    top_n = st.sidebar.number_input("Jumlah produk teratas", min_value=1, value=500, key=f"{mode}_top_n")
+    group = st.sidebar.selectbox("Batasi per", ["(tanpa batas)", SHOP_GROUP, *MODES[mode]['group_cols']],
+                                 key=f"{mode}_group")
+    if group == "(tanpa batas)":
+        return ranking(score, top_n)
+    per_group = st.sidebar.number_input("Maksimal produk per grup", min_value=1, value=5, key=f"{mode}_per_group")
+    return ranking(score, top_n, group, per_group)
+
+
+def apply_ranking(mode, df, passed_rows, options):
+    if options is None:
+        return passed_rows
+    try:
+        with run_profiler().span('peringkat top-N', rows_in=len(passed_rows)) as span:
+            ranked = rank_mode(mode, df, passed_rows, options)
+            span['rows_out'] = len(ranked)
+    except ValueError as e:
+        st.error(f"❌ {e}")
+        return passed_rows
+    st.caption(f"🏆 Menampilkan {len(ranked)} produk teratas dari {len(passed_rows)} produk lolos filter.")
+    return ranked
+
+
+def show_profile(slot, result, mode):
+    # Tahap baca file berasal dari cache jika data tidak dibaca ulang di run ini
+    run = st.session_state['run_profile']
+    from_cache = result['profiled_at'] < run['started']
+    records = [(record, 'cache' if from_cache else 'run ini') for record in result['profile']]
+    records += [(record, 'run ini') for record in run['profiler'].records()]
+    table = pd.DataFrame([{
+        'Tahap': record['stage'],
+        'Sumber': source,
+        'Panggilan': record['calls'],
+        'Waktu (detik)': round(record['seconds'], 3),
+        'Baris masuk': record['rows_in'],
+        'Baris keluar': record['rows_out'],
+        'Memori puncak': format_bytes(record['peak_bytes']) if record['peak_bytes'] is not None else '-',
+    } for record, source in records])
+    with slot.container():
+        with st.expander("⏱️ Profil"):
+            st.dataframe(table)
+            st.caption("Waktu tahap per file dijumlahkan dari semua file yang dibaca paralel. "
+                       + ("" if tracemalloc.is_tracing() else "Memori puncak diukur jika PROFILE_TRACE_MEMORY=1."))
+            usage = shared_result_cache().usage()
+            st.caption(f"Cache hasil (seluruh server): {usage['entries']} entri, "
+                       f"{format_bytes(usage['memory_bytes'])} di memori; diambil dari memori {usage['memory']}x, "
+                       f"dari disk {usage['disk']}x, dibaca ulang dari file {usage['miss']}x.")
+    write_log((result['profile'] if not from_cache else []) + run['profiler'].records(),
+              mode=mode, from_cache=from_cache, rows=result['total_rows'])
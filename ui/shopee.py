@@ -0,0 +1,115 @@
+import numpy as np
+import streamlit as st
+
+from shopee_filter.exporter import EXPORT_FORMATS
+from shopee_filter.filter_engine import partition_rows
+from shopee_filter.modes import MODES
+from shopee_filter.pipeline import filter_mode
+
+from .common import (apply_ranking, download_section, link_stats_html, load_uploaded_files_cached,
+                     make_cache_key, memory_stats_html, process_requested, ranking_sidebar, show_file_stats,
+                     show_filter_stats, show_load_errors, show_paged_table, show_profile, shuffle_seed,
+                     start_run, telegram_section)
+
+
+# === FILTER PRODUK SHOPEE TOKO LOKAL ===
+def render():
+    profiler = start_run()
+    st.title("📦 Filter Produk Shopee - Toko Lokal")
+    st.markdown("Upload file produk dari Shopee dengan format kolom minimal seperti contoh.")
+
+    # Sidebar Filters
+    defaults = MODES['shopee']['defaults']
+    st.sidebar.title("🛠️ Filter Produk Shopee")
+    harga_min_shopee = st.sidebar.number_input("Harga minimum", min_value=0.0, value=defaults['harga_min'])
+    stok_min_shopee = st.sidebar.number_input("Stok minimum", min_value=0, value=defaults['stok_min'])
+    terjual_bulanan_min = st.sidebar.number_input("Terjual Bulanan minimum", min_value=0,
+                                                  value=defaults['terjual_bulanan_min'])
+    rating_min_shopee = st.sidebar.slider("Rating minimum", min_value=0.0, max_value=5.0,
+                                          value=defaults['rating_min'], step=0.1)
+    lokasi_khusus = st.sidebar.text_input("Lokasi toko (opsional)", value=defaults['lokasi_khusus'],
+                                          help="Contoh: JAKARTA")
+    shuffle_products = st.sidebar.checkbox("Acak urutan produk", value=False)
+    skip_seen = st.sidebar.checkbox("Lewati produk yang sudah pernah diproses", value=True,
+                                    help="Produk dengan link dan data yang sama dari upload sebelumnya tidak diproses lagi")
+    rank_options = ranking_sidebar('shopee')
+
+    uploaded_files = st.file_uploader("Unggah File CSV / TXT", type=["csv", "txt"], accept_multiple_files=True)
+
+    thresholds = {
+        'harga_min': harga_min_shopee,
+        'stok_min': stok_min_shopee,
+        'terjual_bulanan_min': terjual_bulanan_min,
+        'rating_min': rating_min_shopee,
+        'lokasi_khusus': lokasi_khusus,
+    }
+
+    if uploaded_files:
+        custom_filename = st.text_input("Masukkan nama file CSV untuk produk lolos filter", value="shopee_lokal_lolos")
+        custom_filename_sampah = st.text_input("Masukkan nama file CSV untuk produk tidak lolos filter", value="shopee_lokal_sampah")
+        export_format = st.selectbox("Format file unduhan", list(EXPORT_FORMATS))
+
+        if process_requested(st.button("🔎 Proses Data Shopee"), 'shopee_processed', uploaded_files):
+            with st.spinner("⏳ Memproses..."):
+                cache_key = make_cache_key('shopee', uploaded_files, bool(lokasi_khusus),
+                                           tuple(file.name.endswith('.txt') for file in uploaded_files))
+                result = load_uploaded_files_cached(cache_key, uploaded_files, thresholds, skip_seen=skip_seen)
+                if result is None:
+                    st.error("❌ Gagal memproses data karena kolom penting tidak ditemukan.")
+                    st.stop()
+                show_load_errors(result)
+
+                if result['total_rows'] > 0:
+                    total_produk_sebelum = result['total_rows']
+                    deleted_dupes = result['deleted_dupes']
+                    unique_rows = result['unique_rows']
+                    processed_df = result['combined_df']
+                    with profiler.span('filter', rows_in=unique_rows) as span:
+                        passed, filter_stats = filter_mode('shopee', processed_df, thresholds)
+                        passed_count = span['rows_out'] = int(np.count_nonzero(passed))
+
+                    avg_harga = round(processed_df['Harga'][passed].mean(), 2) if passed_count else 0
+                    avg_rating = round(processed_df['Rating'][passed].mean(), 1) if passed_count else 0
+
+                    st.success(f"✅ {passed_count} produk lolos filter.")
+                    st.markdown(f"""
+                    <div class="stat-box">
+                        <div class="section-title">📊 Statistik</div>
+                        <ul>
+                            <li>Total produk diproses: <strong>{total_produk_sebelum}</strong></li>
+                            <li>Produk unik setelah hapus duplikat: <strong>{unique_rows}</strong></li>
+                            <li>Produk lolos filter: <strong>{passed_count}</strong></li>
+                            <li>Duplikat yang dihapus: <strong>{deleted_dupes}</strong></li>
+                            <li>Rata-rata harga: <strong>Rp{avg_harga:,.0f}</strong></li>
+                            <li>Rata-rata rating: <strong>{avg_rating}</strong></li>{link_stats_html(result['links'])}{memory_stats_html(result['memory'])}
+                        </ul>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    profile_slot = st.empty()
+                    show_file_stats(result['file_stats'])
+                    show_filter_stats(filter_stats)
+
+                    # Data lolos/tidak lolos cukup berupa posisi baris atas data gabungan
+                    with profiler.span('pisahkan lolos/sampah', rows_in=unique_rows):
+                        passed_rows, removed_rows = partition_rows(passed)
+                        if shuffle_products:
+                            passed_rows = np.random.default_rng(shuffle_seed()).permutation(passed_rows)
+
+                    passed_rows = apply_ranking('shopee', processed_df, passed_rows, rank_options)
+
+                    st.subheader("✅ Produk Lolos Filter")
+                    show_paged_table(processed_df, passed_rows, 'shopee_lolos')
+                    download_section("Produk Lolos", processed_df, passed_rows, custom_filename,
+                                     export_format, (cache_key, skip_seen))
+                    telegram_section("Produk Lolos", 'shopee', processed_df, passed_rows, custom_filename,
+                                     (cache_key, skip_seen))
+
+                    st.subheader("🗑️ Produk Tidak Lolos")
+                    show_paged_table(processed_df, removed_rows, 'shopee_sampah')
+                    download_section("Sampah", processed_df, removed_rows, custom_filename_sampah,
+                                     export_format, (cache_key, skip_seen))
+                    show_profile(profile_slot, result, 'shopee')
+                else:
+                    st.warning("⚠️ Tidak ada data valid yang dapat diproses.")
+    else:
+        st.info("📁 Silakan upload file produk Shopee.")
@@ -0,0 +1,115 @@
+import numpy as np
+import streamlit as st
+
+from shopee_filter.exporter import EXPORT_FORMATS
+from shopee_filter.filter_engine import partition_rows
+from shopee_filter.modes import MODES
+from shopee_filter.pipeline import filter_mode
+
+from .common import (apply_ranking, download_section, link_stats_html, load_uploaded_files_cached,
+                     make_cache_key, memory_stats_html, process_requested, ranking_sidebar, show_file_stats,
+                     show_filter_stats, show_load_errors, show_paged_table, show_profile, shuffle_seed,
+                     start_run, telegram_section)
+
+
+# === FILTER PRODUK SHOPTIK ===
+def render():
+    profiler = start_run()
+    st.title("📱 Filter Produk Shoptik")
+    st.markdown("Gunakan filter di bawah ini untuk menganalisis produk dari Shoptik.")
+
+    # Sidebar Filters
+    defaults = MODES['shoptik']['defaults']
+    st.sidebar.title("⚙️ Filter Shoptik")
+    trend_percentage_min = st.sidebar.number_input("Tren minimum (%)", min_value=0.0, value=defaults['trend_percentage_min'],
+                                                 help="Persentase tren minimum untuk produk")
+    harga_min_shoptik = st.sidebar.number_input("Harga minimum", min_value=0.0, value=defaults['harga_min'],
+                                              help="Hanya produk dengan harga di atas nilai ini yang akan diproses")
+    penjualan_30_hari_min = st.sidebar.number_input("Penjualan minimum (30 Hari)", min_value=0, value=defaults['penjualan_30_hari_min'],
+                                                  help="Produk dengan penjualan kurang dari nilai ini tidak lolos")
+    stok_min_shoptik = st.sidebar.number_input("Minimal stok", min_value=0, value=defaults['stok_min'],
+                                             help="Produk dengan stok di bawah nilai ini tidak lolos")
+    rating_min = st.sidebar.slider("Rating minimum", min_value=0.0, max_value=5.0, value=defaults['rating_min'], step=0.1,
+                                   help="Rating minimum produk")
+    is_ad = st.sidebar.checkbox("Tampilkan hanya produk beriklan", value=defaults['is_ad'],
+                                help="Selain produk ber add tidak akan di proses")
+    shuffle_products = st.sidebar.checkbox("Acak produk", value=False, help="Centang maka produk anda akan morat-morat.")
+    skip_seen = st.sidebar.checkbox("Lewati produk yang sudah pernah diproses", value=True,
+                                    help="Produk dengan link dan data yang sama dari upload sebelumnya tidak diproses lagi")
+    rank_options = ranking_sidebar('shoptik')
+    uploaded_files = st.file_uploader("Masukkan File", type=["csv"], accept_multiple_files=True)
+    thresholds = {
+        'trend_percentage_min': trend_percentage_min,
+        'harga_min': harga_min_shoptik,
+        'penjualan_30_hari_min': penjualan_30_hari_min,
+        'stok_min': stok_min_shoptik,
+        'rating_min': rating_min,
+        'is_ad': is_ad,
+    }
+
+    if uploaded_files:
+        custom_filename = st.text_input("Masukkan nama file CSV untuk produk lolos filter", value="data_shoptik")
+        custom_filename_sampah = st.text_input("Masukkan nama file CSV untuk produk tidak lolos filter", value="sampah_shoptik")
+        export_format = st.selectbox("Format file unduhan", list(EXPORT_FORMATS))
+
+        if process_requested(st.button("🔎 Analisis Data"), 'shoptik_processed', uploaded_files):
+            with st.spinner("⏳ Menganalisis data Shoptik..."):
+                cache_key = make_cache_key('shoptik', uploaded_files)
+                result = load_uploaded_files_cached(cache_key, uploaded_files, thresholds, skip_seen=skip_seen)
+                show_load_errors(result)
+
+                if result['total_rows'] > 0:
+                    total_products = result['total_rows']
+                    deleted_dupes = result['deleted_dupes']
+                    unique_rows = result['unique_rows']
+                    combined_df = result['combined_df']
+                    with profiler.span('filter', rows_in=unique_rows) as span:
+                        passed, filter_stats = filter_mode('shoptik', combined_df, thresholds)
+                        passed_count = span['rows_out'] = int(np.count_nonzero(passed))
+
+                    avg_rating = round(combined_df['Peringkat'][passed].mean(), 1) if passed_count else 0
+                    avg_trend = round(combined_df['trendPercentage'][passed].mean(), 1) if passed_count else 0
+
+                    st.success("✅ Analisis selesai!")
+                    st.markdown(f"""
+                    <div class="stat-box">
+                        <div class="section-title">📊 Statistik Shoptik</div>
+                        <ul>
+                            <li>Total produk diproses: <strong>{total_products}</strong></li>
+                            <li>Produk unik setelah hapus duplikat: <strong>{unique_rows}</strong></li>
+                            <li>Produk lolos filter: <strong>{passed_count}</strong></li>
+                            <li>Produk tidak lolos filter: <strong>{unique_rows - passed_count}</strong></li>
+                            <li>Duplikat berdasarkan link: <strong>{deleted_dupes}</strong></li>
+                            <li>Rata-rata rating: <strong>{avg_rating}</strong></li>
+                            <li>Rata-rata tren (%): <strong>{avg_trend}%</strong></li>{link_stats_html(result['links'])}{memory_stats_html(result['memory'])}
+                        </ul>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    profile_slot = st.empty()
+                    show_file_stats(result['file_stats'])
+                    show_filter_stats(filter_stats)
+
+                    # Data lolos/tidak lolos cukup berupa posisi baris atas data gabungan
+                    with profiler.span('pisahkan lolos/sampah', rows_in=unique_rows):
+                        passed_rows, removed_rows = partition_rows(
+                            passed, shuffle=shuffle_products, seed=shuffle_seed()
+                        )
+
+                    passed_rows = apply_ranking('shoptik', combined_df, passed_rows, rank_options)
+
+                    st.subheader("✅ Produk Lolos Filter")
+                    show_paged_table(combined_df, passed_rows, 'shoptik_lolos')
+                    download_section("Data Shoptik", combined_df, passed_rows, custom_filename,
+                                     export_format, (cache_key, skip_seen))
+                    telegram_section("Data Shoptik", 'shoptik', combined_df, passed_rows, custom_filename,
+                                     (cache_key, skip_seen))
+
+                    st.subheader("🗑️ Produk Dihapus")
+                    show_paged_table(combined_df, removed_rows, 'shoptik_sampah')
+                    download_section("Sampah", combined_df, removed_rows, custom_filename_sampah,
+                                     export_format, (cache_key, skip_seen))
+                    show_profile(profile_slot, result, 'shoptik')
+                else:
+                    st.warning("Tidak ada data valid untuk dianalisis.")
+    else:
+        st.info("📁 Silakan upload file")
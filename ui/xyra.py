@@ -0,0 +1,128 @@
+import numpy as np
+import streamlit as st
+
+from shopee_filter.exporter import EXPORT_FORMATS
+from shopee_filter.filter_engine import partition_rows
+from shopee_filter.modes import MODES
+from shopee_filter.pipeline import filter_mode
+
+from .common import (apply_ranking, download_section, link_stats_html, load_uploaded_files_cached,
+                     make_cache_key, memory_stats_html, process_requested, ranking_sidebar, show_file_stats,
+                     show_filter_stats, show_load_errors, show_paged_table, show_profile, shuffle_seed,
+                     start_run, telegram_section)
+
+
+# === FILTER PRODUK EXTENSION XYRA ===
+def render():
+    profiler = start_run()
+    st.title("🛒 Filter Produk Extension Xyra")
+    st.markdown("Hanya Support File Export Extensi Xyra v4.2.")
+
+    # Sidebar Filters
+    defaults = MODES['xyra']['defaults']
+    st.sidebar.title("🚬 Filter Black")
+    stok_min = st.sidebar.number_input("Batas minimal stok", min_value=0, value=defaults['stok_min'],
+                                      help="Produk dengan stok kurang dari nilai ini akan diabaikan")
+    harga_min = st.sidebar.number_input("Batas minimal harga produk", min_value=0.0, value=defaults['harga_min'],
+                                       help="Hanya produk di atas harga ini yang akan diproses")
+    col1, col2 = st.sidebar.columns(2)
+    with col1:
+        terjual_min = st.number_input("Min terjual per bulan", min_value=0, value=defaults['terjual_min'],
+                                      help="Produk dengan penjualan bulanan kurang dari nilai ini tidak akan diproses")
+    with col2:
+        terjual_max = st.number_input("Max terjual per bulan", min_value=0, value=defaults['terjual_max'],
+                                      help="Produk dengan penjualan bulanan lebih dari nilai ini tidak akan diproses")
+    komisi_persen_min = st.sidebar.number_input("Min komisi (%)", min_value=0.0, value=defaults['komisi_persen_min'],
+                                               help="Produk dengan komisi kurang dari persentase ini tidak akan diproses")
+    komisi_persen_max = st.sidebar.number_input("Max komisi (%)", min_value=0.0, value=defaults['komisi_persen_max'],
+                                               help="Produk dengan komisi lebih dari persentase ini tidak akan diproses")
+    komisi_rp_min = st.sidebar.number_input("Min komisi (Rp)", min_value=0.0, value=defaults['komisi_rp_min'],
+                                            help="Produk dengan komisi kurang dari nilai ini tidak akan diproses")
+    komisi_rp_max = st.sidebar.number_input("Max komisi (Rp)", min_value=0.0, value=defaults['komisi_rp_max'],
+                                            help="Produk dengan komisi lebih dari nilai ini tidak akan diproses")
+    jumlah_live_min = st.sidebar.number_input("Min jumlah live", min_value=0, value=defaults['jumlah_live_min'],
+                                             help="Minimum jumlah live listing untuk produk")
+    jumlah_live_max = st.sidebar.number_input("Max jumlah live", min_value=0, value=defaults['jumlah_live_max'],
+                                             help="Maksimum jumlah live listing untuk produk")
+    shuffle_products = st.sidebar.checkbox("Acak produk", value=False, help="Centang maka produk anda akan morat-morat.")
+    skip_seen = st.sidebar.checkbox("Lewati produk yang sudah pernah diproses", value=True,
+                                    help="Produk dengan link dan data yang sama dari upload sebelumnya tidak diproses lagi")
+    rank_options = ranking_sidebar('xyra')
+    uploaded_files = st.file_uploader("Masukkan File di Sini", type=["txt"], accept_multiple_files=True)
+    thresholds = {
+        'stok_min': stok_min,
+        'harga_min': harga_min,
+        'terjual_min': terjual_min,
+        'terjual_max': terjual_max,
+        'komisi_persen_min': komisi_persen_min,
+        'komisi_persen_max': komisi_persen_max,
+        'komisi_rp_min': komisi_rp_min,
+        'komisi_rp_max': komisi_rp_max,
+        'jumlah_live_min': jumlah_live_min,
+        'jumlah_live_max': jumlah_live_max,
+    }
+
+    if uploaded_files:
+        custom_filename = st.text_input("Masukkan nama file CSV untuk produk lolos filter", value="data_produk")
+        custom_filename_sampah = st.text_input("Masukkan nama file CSV untuk produk tidak lolos filter", value="sampah")
+        export_format = st.selectbox("Format file unduhan", list(EXPORT_FORMATS))
+
+        if process_requested(st.button("🚀 Proses Data"), 'xyra_processed', uploaded_files):
+            with st.spinner("⏳ Memproses data..."):
+                cache_key = make_cache_key('xyra', uploaded_files)
+                result = load_uploaded_files_cached(cache_key, uploaded_files, thresholds, skip_seen=skip_seen)
+                show_load_errors(result)
+
+                if result['total_rows'] > 0:
+                    total_links = result['total_rows']
+                    deleted_dupes = result['deleted_dupes']
+                    unique_rows = result['unique_rows']
+                    combined_df = result['combined_df']
+                    with profiler.span('filter', rows_in=unique_rows) as span:
+                        passed, filter_stats = filter_mode('xyra', combined_df, thresholds)
+                        passed_count = span['rows_out'] = int(np.count_nonzero(passed))
+
+                    avg_live = round(combined_df['Jumlah Live'][passed].mean(), 1) if passed_count else 0
+
+                    st.success("✅ Data berhasil diproses!")
+                    st.markdown(f"""
+                    <div class="stat-box">
+                        <div class="section-title">📊 Statistik</div>
+                        <ul>
+                            <li>Total produk diproses: <strong>{total_links}</strong></li>
+                            <li>Produk unik setelah hapus duplikat: <strong>{unique_rows}</strong></li>
+                            <li>Produk lolos filter: <strong>{passed_count}</strong></li>
+                            <li>Produk tidak lolos filter: <strong>{unique_rows - passed_count}</strong></li>
+                            <li>Duplikat yang dihapus: <strong>{deleted_dupes}</strong></li>
+                            <li>Rata-rata jumlah live: <strong>{avg_live}</strong></li>{link_stats_html(result['links'])}{memory_stats_html(result['memory'])}
+                        </ul>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    profile_slot = st.empty()
+                    show_file_stats(result['file_stats'])
+                    show_filter_stats(filter_stats)
+
+                    # Data lolos/tidak lolos cukup berupa posisi baris atas data gabungan
+                    with profiler.span('pisahkan lolos/sampah', rows_in=unique_rows):
+                        passed_rows, removed_rows = partition_rows(
+                            passed, shuffle=shuffle_products, seed=shuffle_seed()
+                        )
+
+                    passed_rows = apply_ranking('xyra', combined_df, passed_rows, rank_options)
+
+                    st.subheader("✅ Final Produk")
+                    show_paged_table(combined_df, passed_rows, 'xyra_lolos')
+                    download_section("Data Produk", combined_df, passed_rows, custom_filename,
+                                     export_format, (cache_key, skip_seen))
+                    telegram_section("Data Produk", 'xyra', combined_df, passed_rows, custom_filename,
+                                     (cache_key, skip_seen))
+
+                    st.subheader("🗑️ Produk Sampah")
+                    show_paged_table(combined_df, removed_rows, 'xyra_sampah')
+                    download_section("Sampah", combined_df, removed_rows, custom_filename_sampah,
+                                     export_format, (cache_key, skip_seen))
+                    show_profile(profile_slot, result, 'xyra')
+                else:
+                    st.warning("Tidak ada data valid yang bisa diproses.")
+    else:
+        st.info("📁 Silakan upload file terlebih dahulu.")